@@ -2,7 +2,6 @@
 """Deployer API for deployment operations"""
 
 import asyncio
-import json
 import shutil
 import time
 from pathlib import Path
@@ -22,6 +21,7 @@ from ..models import (
     Component,
 )
 from ..models.manifest import ReleaseManifest
+from ..utils.json_utils import load_json_file
 from .exceptions import (
     DeployError,
     ReleaseNotFoundError,
@@ -322,10 +322,7 @@ class Deployer:
                 raise ReleaseNotFoundError(release_version)
 
         # Load manifest
-        with open(release_path, 'r') as f:
-            data = json.load(f)
-
-        return ReleaseManifest.from_dict(data)
+        return ReleaseManifest.from_dict(load_json_file(release_path))
 
     def _extract_components_from_release(self, release_manifest: ReleaseManifest) -> List[Component]:
         """Extract component list from release manifest"""
@@ -324,10 +324,11 @@ class Packer:
                 version=version,
                 manifest_path=str(manifest_path),
                 archive_path=str(archive_path),
+                archive_size=manifest.archive['size'],
                 duration=time.time() - start_time,
                 metadata={
                     'compression': compress_algo,
-                    'archive_size': archive_path.stat().st_size,
+                    'archive_size': manifest.archive['size'],
                 }
             )
 
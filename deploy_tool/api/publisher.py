@@ -27,6 +27,7 @@ from ..models import (
     PublishComponent,
 )
 from ..models.manifest import ReleaseManifest, ComponentRef
+from ..utils.json_utils import save_json_file
 
 
 class Publisher:
@@ -132,6 +133,7 @@ class Publisher:
         """Async publish implementation"""
         start_time = time.time()
         published_components = []
+        successful_components = []  # Filled as components publish, in order
         errors = []
 
         try:
@@ -175,6 +177,8 @@ class Publisher:
                         component, force
                     )
                     published_components.append(result)
+                    if result.success:
+                        successful_components.append(result)
 
                 except Exception as e:
                     error_result = ComponentPublishResult(
@@ -187,7 +191,7 @@ class Publisher:
 
                     if atomic:
                         # Rollback if atomic
-                        await self._rollback_published(published_components[:-1])
+                        await self._rollback_published(successful_components)
                         raise PublishError(
                             f"Atomic publish failed: {str(e)}"
                         )
@@ -198,7 +202,7 @@ class Publisher:
                 release_manifest = self._create_release_manifest(
                     release_version,
                     release_name,
-                    published_components
+                    successful_components
                 )
 
                 # Save release manifest
@@ -215,7 +219,7 @@ class Publisher:
                 # Provide git advice
                 self.git_advisor.provide_post_publish_advice(
                     release_version,
-                    [Path(c.component.manifest_path) for c in published_components]
+                    [Path(c.component.manifest_path) for c in successful_components]
                 )
 
             # Create result
@@ -255,7 +259,10 @@ class Publisher:
                 )
 
             archive_path = self.path_resolver.resolve(archive_location)
-            if not archive_path.exists():
+            # One stat() both checks the archive exists and gives its size
+            try:
+                archive_size = archive_path.stat().st_size
+            except OSError:
                 raise PublishError(
                     f"Archive file not found: {archive_path}"
                 )
@@ -298,7 +305,7 @@ class Publisher:
 
             # Update component info
             component.archive_path = str(archive_path)
-            component.archive_size = archive_path.stat().st_size
+            component.archive_size = archive_size
             component.storage_path = storage_path
 
             # Register in component registry
@@ -321,33 +328,31 @@ class Publisher:
 
     async def _rollback_published(self,
                                   components: List[ComponentPublishResult]):
-        """Rollback published components"""
+        """Rollback successfully published components"""
         for comp_result in components:
-            if comp_result.success:
-                try:
-                    await self.storage_manager.delete_component(
-                        comp_result.component.type,
-                        comp_result.component.version
-                    )
-                except Exception:
-                    # Ignore rollback errors
-                    pass
+            try:
+                await self.storage_manager.delete_component(
+                    comp_result.component.type,
+                    comp_result.component.version
+                )
+            except Exception:
+                # Ignore rollback errors
+                pass
 
     def _create_release_manifest(self,
                                  release_version: str,
                                  release_name: str,
                                  components: List[ComponentPublishResult]) -> ReleaseManifest:
-        """Create release manifest"""
+        """Create release manifest from successfully published components"""
         # Create component references
-        component_refs = []
-        for comp_result in components:
-            if comp_result.success:
-                ref = ComponentRef(
-                    type=comp_result.component.type,
-                    version=comp_result.component.version,
-                    manifest=comp_result.component.manifest_path
-                )
-                component_refs.append(ref)
+        component_refs = [
+            ComponentRef(
+                type=comp_result.component.type,
+                version=comp_result.component.version,
+                manifest=comp_result.component.manifest_path
+            )
+            for comp_result in components
+        ]
 
         # Create release info
         release_info = {
@@ -376,9 +381,7 @@ class Publisher:
         release_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save
-        import json
-        with open(release_path, 'w') as f:
-            json.dump(release_manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        save_json_file(release_path, release_manifest)
 
         return release_path
 
@@ -2,6 +2,7 @@
 """Query API for querying deployment information"""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 from ..core import (
@@ -12,6 +13,12 @@ from ..core import (
 from ..models import Component
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (cached, release timestamps repeat across queries)"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 class QueryInterface:
     """Query interface for deployment information"""
 
@@ -64,11 +71,10 @@ class QueryInterface:
         # Filter by version pattern if specified
         if version_pattern:
             import fnmatch
-            filtered = []
-            for comp in components:
-                if fnmatch.fnmatch(comp.version, version_pattern):
-                    filtered.append(comp)
-            components = filtered
+            components = [
+                comp for comp in components
+                if fnmatch.fnmatch(comp.version, version_pattern)
+            ]
 
         # Sort
         if sort_by == "version":
@@ -124,7 +130,7 @@ class QueryInterface:
                 # Check date filter
                 created_at = release_data['release'].get('created_at')
                 if created_at:
-                    created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                    created_dt = _parse_timestamp(created_at)
 
                     if from_dt and created_dt < from_dt:
                         continue
@@ -132,16 +138,12 @@ class QueryInterface:
                         continue
 
                 # Check component filter
-                if filter_type:
-                    contains = False
-                    for comp in release_data.get('components', []):
-                        if comp['type'] == filter_type:
-                            if not filter_version or comp['version'] == filter_version:
-                                contains = True
-                                break
-
-                    if not contains:
-                        continue
+                if filter_type and not any(
+                    comp['type'] == filter_type and
+                    (not filter_version or comp['version'] == filter_version)
+                    for comp in release_data.get('components', [])
+                ):
+                    continue
 
                 # Add to results
                 releases.append({
@@ -14,6 +14,12 @@ from ..decorators import require_project
 
 console = Console()
 
+# Directory tree display rules
+_SHOWN_DOTFILES = frozenset({'.deploy-tool.yaml'})
+_SKIPPED_DIRS = frozenset({'__pycache__', 'node_modules', '.git'})
+_ARCHIVE_SUFFIXES = ('.tar.gz', '.zip')
+_SUFFIX_ICONS = {'.yaml': "⚙️", '.json': "📋"}
+
 
 @click.command()
 @click.option('--resolve', help='Resolve a specific path')
@@ -100,25 +106,23 @@ def paths(ctx, resolve, tree, validate, show_config):
                 return
 
             try:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-                for item in items:
-                    if item.name.startswith('.') and item.name not in ['.deploy-tool.yaml']:
+                # Stat each entry once; directories first, then by name
+                items = sorted((not item.is_dir(), item.name, item) for item in path.iterdir())
+                for is_file, name, item in items:
+                    if name.startswith('.') and name not in _SHOWN_DOTFILES:
                         continue
 
-                    if item.is_dir():
-                        if item.name in ['__pycache__', 'node_modules', '.git']:
+                    if not is_file:
+                        if name in _SKIPPED_DIRS:
                             continue
-                        branch = tree_node.add(f"📁 {item.name}/")
+                        branch = tree_node.add(f"📁 {name}/")
                         build_tree(item, branch, max_depth, current_depth + 1)
                     else:
-                        icon = "📄"
-                        if item.suffix == '.yaml':
-                            icon = "⚙️"
-                        elif item.suffix == '.json':
-                            icon = "📋"
-                        elif item.suffix in ['.tar.gz', '.zip']:
+                        if name.endswith(_ARCHIVE_SUFFIXES):
                             icon = "📦"
-                        tree_node.add(f"{icon} {item.name}")
+                        else:
+                            icon = _SUFFIX_ICONS.get(item.suffix, "📄")
+                        tree_node.add(f"{icon} {name}")
 
             except PermissionError:
                 tree_node.add("[red]Permission Denied[/red]")
@@ -101,12 +101,9 @@ def format_deploy_result(result: DeployResult) -> None:
             f"",
             f"[bold]Target:[/bold] {result.deploy_target}",
             f"[bold]Components:[/bold] {len(result.deployed_components)}",
+            f"[bold]Type:[/bold] {result.deploy_type}",
         ]
 
-        # Add deployment type info
-        if hasattr(result, 'deploy_type'):
-            lines.append(f"[bold]Type:[/bold] {result.deploy_type}")
-
         # Verification status
         if result.verification:
             status = "[green]Passed[/green]" if result.verification.success else "[red]Failed[/red]"
@@ -118,7 +115,7 @@ def format_deploy_result(result: DeployResult) -> None:
                 if result.verification.error:
                     lines.append(f"  [red]• {result.verification.error}[/red]")
                 # Show issues (if any)
-                if hasattr(result.verification, 'issues') and result.verification.issues:
+                if result.verification.issues:
                     for issue in result.verification.issues[:3]:  # Show max 3 issues
                         lines.append(f"  [red]• {issue}[/red]")
 
@@ -1,7 +1,7 @@
 ﻿# deploy_tool/core/component_registry.py
 """Component registry for managing component versions and dependencies"""
 
-import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +12,10 @@ from packaging.version import parse
 from .manifest_engine import ManifestEngine
 from .path_resolver import PathResolver
 from ..models.component import Component
+from ..utils.json_utils import load_json_file, save_json_file
+
+# Keys ComponentInfo.from_dict requires in every index entry
+_REQUIRED_INFO_KEYS = frozenset(('type', 'version', 'created_at', 'manifest_path'))
 
 
 @dataclass
@@ -20,8 +24,8 @@ class ComponentInfo:
     type: str
     version: str
     created_at: str
-    manifest_path: Path
-    archive_path: Optional[Path] = None
+    manifest_path: str  # Kept as str: the index stores and callers consume strings
+    archive_path: Optional[str] = None
     size: int = 0
     checksum: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -32,13 +36,28 @@ class ComponentInfo:
             'type': self.type,
             'version': self.version,
             'created_at': self.created_at,
-            'manifest_path': str(self.manifest_path),
-            'archive_path': str(self.archive_path) if self.archive_path else None,
+            'manifest_path': self.manifest_path,
+            'archive_path': self.archive_path,
             'size': self.size,
             'checksum': self.checksum,
             'metadata': self.metadata
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ComponentInfo':
+        """Create from dictionary"""
+        component_type = data['type']
+        return cls(
+            type=sys.intern(component_type) if isinstance(component_type, str) else component_type,
+            version=data['version'],
+            created_at=data['created_at'],
+            manifest_path=data['manifest_path'],
+            archive_path=data.get('archive_path') or None,
+            size=data.get('size', 0),
+            checksum=data.get('checksum'),
+            metadata=data.get('metadata', {})
+        )
+
 
 @dataclass
 class ComponentIndex:
@@ -46,16 +65,69 @@ class ComponentIndex:
     version: str = "1.0"
     updated_at: str = ""
     components: Dict[str, List[ComponentInfo]] = field(default_factory=dict)
+    _by_version: Dict[Tuple[str, str], ComponentInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Cached entries not parsed yet, keyed by type (parsed on first access)
+    _raw: Dict[str, List[dict]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _materialize(self, component_type: str) -> None:
+        """Parse the cached entries of a component type"""
+        raw = self._raw.pop(component_type, None)
+        if raw:
+            for data in raw:
+                self.add(ComponentInfo.from_dict(data))
+
+    def add(self, info: ComponentInfo) -> None:
+        """Add a component version, replacing an existing entry in place"""
+        self._materialize(info.type)
+        key = (info.type, info.version)
+        versions = self.components.setdefault(info.type, [])
+        existing = self._by_version.get(key)
+
+        if existing is None:
+            versions.append(info)
+        else:
+            for i, entry in enumerate(versions):
+                if entry is existing:
+                    versions[i] = info
+                    break
+
+        self._by_version[key] = info
+
+    def find(self, component_type: str, version: str) -> Optional[ComponentInfo]:
+        """Find a component version through the (type, version) index"""
+        self._materialize(component_type)
+        return self._by_version.get((component_type, version))
+
+    def get_versions(self, component_type: str) -> List[ComponentInfo]:
+        """Get the versions of a component type (newest first)"""
+        self._materialize(component_type)
+        return self.components.get(component_type, [])
+
+    def get_types(self) -> List[str]:
+        """Get all component types without parsing their entries"""
+        return sorted(self.components.keys() | self._raw.keys())
+
+    def load_all(self) -> Dict[str, List[ComponentInfo]]:
+        """Parse every cached entry and return all versions by type"""
+        for comp_type in list(self._raw):
+            self._materialize(comp_type)
+        return self.components
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
+        # Unparsed entries are written back as loaded
+        components = dict(self._raw)
+        for comp_type, infos in self.components.items():
+            components[comp_type] = [info.to_dict() for info in infos]
+
         return {
             'version': self.version,
             'updated_at': self.updated_at,
-            'components': {
-                comp_type: [info.to_dict() for info in infos]
-                for comp_type, infos in self.components.items()
-            }
+            'components': components
         }
 
     @classmethod
@@ -66,20 +138,15 @@ class ComponentIndex:
             updated_at=data.get('updated_at', '')
         )
 
-        for comp_type, infos in data.get('components', {}).items():
-            index.components[comp_type] = [
-                ComponentInfo(
-                    type=info['type'],
-                    version=info['version'],
-                    created_at=info['created_at'],
-                    manifest_path=Path(info['manifest_path']),
-                    archive_path=Path(info['archive_path']) if info.get('archive_path') else None,
-                    size=info.get('size', 0),
-                    checksum=info.get('checksum'),
-                    metadata=info.get('metadata', {})
-                )
-                for info in infos
-            ]
+        # Entries are parsed per type on first access; only check their shape
+        # here, so a corrupted index still fails while loading (and is rebuilt)
+        components = data.get('components', {})
+        for comp_type, entries in components.items():
+            if not isinstance(entries, list) or not all(
+                    isinstance(entry, dict) and _REQUIRED_INFO_KEYS <= entry.keys()
+                    for entry in entries):
+                raise ValueError(f"Malformed index entries for component type: {comp_type}")
+        index._raw.update(components)
 
         return index
 
@@ -106,9 +173,7 @@ class ComponentRegistry:
         """Load component index from cache"""
         if self._index_path.exists():
             try:
-                with open(self._index_path, 'r') as f:
-                    data = json.load(f)
-                return ComponentIndex.from_dict(data)
+                return ComponentIndex.from_dict(load_json_file(self._index_path))
             except:
                 # Corrupted index, rebuild
                 pass
@@ -123,8 +188,8 @@ class ComponentRegistry:
 
         self._index.updated_at = datetime.now().isoformat()
 
-        with open(self._index_path, 'w') as f:
-            json.dump(self._index.to_dict(), f, indent=2)
+        # Machine-only cache file: write compact JSON
+        save_json_file(self._index_path, self._index, indent=False)
 
     def _rebuild_index(self) -> ComponentIndex:
         """Rebuild component index from manifests"""
@@ -147,7 +212,7 @@ class ComponentRegistry:
                     type=comp_type,
                     version=version,
                     created_at=manifest.package.get('created_at', ''),
-                    manifest_path=manifest_path,
+                    manifest_path=str(manifest_path),
                     size=manifest.archive.get('size', 0),
                     checksum=manifest.archive.get('checksum', {}).get('sha256'),
                     metadata=manifest.metadata
@@ -158,13 +223,10 @@ class ComponentRegistry:
                 if archive_location:
                     archive_path = self.path_resolver.resolve(archive_location)
                     if archive_path.exists():
-                        info.archive_path = archive_path
+                        info.archive_path = str(archive_path)
 
                 # Add to index
-                if comp_type not in index.components:
-                    index.components[comp_type] = []
-
-                index.components[comp_type].append(info)
+                index.add(info)
 
             except Exception:
                 # Skip invalid manifests
@@ -199,7 +261,7 @@ class ComponentRegistry:
             type=comp_type,
             version=version,
             created_at=manifest.package.get('created_at', datetime.now().isoformat()),
-            manifest_path=manifest_path,
+            manifest_path=str(manifest_path),
             size=manifest.archive.get('size', 0),
             checksum=manifest.archive.get('checksum', {}).get('sha256'),
             metadata=manifest.metadata
@@ -210,20 +272,10 @@ class ComponentRegistry:
         if archive_location:
             archive_path = self.path_resolver.resolve(archive_location)
             if archive_path.exists():
-                info.archive_path = archive_path
+                info.archive_path = str(archive_path)
 
-        # Add to index
-        if comp_type not in self.index.components:
-            self.index.components[comp_type] = []
-
-        # Remove existing version if present
-        self.index.components[comp_type] = [
-            i for i in self.index.components[comp_type]
-            if i.version != version
-        ]
-
-        # Add new version
-        self.index.components[comp_type].append(info)
+        # Add new version (replaces an existing entry for the same version)
+        self.index.add(info)
 
         # Sort by version
         self.index.components[comp_type].sort(
@@ -245,14 +297,7 @@ class ComponentRegistry:
         Returns:
             ComponentInfo if found, None otherwise
         """
-        if component_type not in self.index.components:
-            return None
-
-        for info in self.index.components[component_type]:
-            if info.version == version:
-                return info
-
-        return None
+        return self.index.find(component_type, version)
 
     def list_components(self, component_type: Optional[str] = None,
                         limit: Optional[int] = None) -> List[Component]:
@@ -270,22 +315,21 @@ class ComponentRegistry:
 
         if component_type:
             # Single type
-            if component_type in self.index.components:
-                for info in self.index.components[component_type][:limit]:
-                    components.append(Component(
-                        type=info.type,
-                        version=info.version,
-                        manifest_path=str(info.manifest_path)
-                    ))
+            for info in self.index.get_versions(component_type)[:limit]:
+                components.append(Component(
+                    type=info.type,
+                    version=info.version,
+                    manifest_path=info.manifest_path
+                ))
         else:
             # All types
             count = 0
-            for comp_type, infos in sorted(self.index.components.items()):
+            for comp_type, infos in sorted(self.index.load_all().items()):
                 for info in infos:
                     components.append(Component(
                         type=info.type,
                         version=info.version,
-                        manifest_path=str(info.manifest_path)
+                        manifest_path=info.manifest_path
                     ))
                     count += 1
                     if limit and count >= limit:
@@ -305,10 +349,7 @@ class ComponentRegistry:
         Returns:
             List of version strings (sorted, newest first)
         """
-        if component_type not in self.index.components:
-            return []
-
-        return [info.version for info in self.index.components[component_type]]
+        return [info.version for info in self.index.get_versions(component_type)]
 
     def get_latest_version(self, component_type: str) -> Optional[str]:
         """
@@ -330,7 +371,7 @@ class ComponentRegistry:
         Returns:
             List of component types
         """
-        return sorted(self.index.components.keys())
+        return self.index.get_types()
 
     def refresh_index(self) -> None:
         """Force refresh of component index"""
@@ -349,7 +390,7 @@ class ComponentRegistry:
         pattern_lower = pattern.lower()
         matches = []
 
-        for comp_type, infos in self.index.components.items():
+        for comp_type, infos in self.index.load_all().items():
             # Check type match
             if pattern_lower in comp_type.lower():
                 # Add all versions
@@ -357,7 +398,7 @@ class ComponentRegistry:
                     matches.append(Component(
                         type=info.type,
                         version=info.version,
-                        manifest_path=str(info.manifest_path)
+                        manifest_path=info.manifest_path
                     ))
             else:
                 # Check version match
@@ -366,22 +407,23 @@ class ComponentRegistry:
                         matches.append(Component(
                             type=info.type,
                             version=info.version,
-                            manifest_path=str(info.manifest_path)
+                            manifest_path=info.manifest_path
                         ))
 
         return matches
 
     def get_component_stats(self) -> Dict[str, Any]:
         """Get component registry statistics"""
+        components = self.index.load_all()
         total_components = 0
         total_size = 0
 
-        for infos in self.index.components.values():
+        for infos in components.values():
             total_components += len(infos)
             total_size += sum(info.size for info in infos)
 
         return {
-            'total_types': len(self.index.components),
+            'total_types': len(components),
             'total_components': total_components,
             'total_size': total_size,
             'index_updated': self.index.updated_at,
@@ -391,7 +433,7 @@ class ComponentRegistry:
                     'latest': infos[0].version if infos else None,
                     'size': sum(info.size for info in infos)
                 }
-                for comp_type, infos in self.index.components.items()
+                for comp_type, infos in components.items()
             }
         }
 
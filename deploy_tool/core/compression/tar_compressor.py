@@ -14,6 +14,7 @@ import tarfile
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Optional, List, Union, Dict, BinaryIO, Tuple
@@ -122,8 +123,13 @@ class CompressionChecker:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def check_availability() -> Dict[CompressionType, CompressionInfo]:
-        """Check availability of all compression algorithms"""
+        """Check availability of all compression algorithms
+
+        The result only depends on import-time module availability, so it is
+        built once and shared; callers must not modify it.
+        """
         info = {
             CompressionType.GZIP: CompressionInfo(
                 name="GZIP",
@@ -177,8 +183,8 @@ class CompressionChecker:
     @staticmethod
     def is_algorithm_available(algorithm: CompressionType) -> bool:
         """Check if a specific algorithm is available"""
-        info_dict = CompressionChecker.check_availability()
-        return info_dict.get(algorithm, CompressionInfo("", "", "", False)).available
+        info = CompressionChecker.check_availability().get(algorithm)
+        return info is not None and info.available
 
     @staticmethod
     def get_missing_dependencies() -> Dict[CompressionType, str]:
@@ -7,7 +7,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
-import yaml
 from rich.console import Console
 from rich.prompt import Prompt
 
@@ -340,8 +339,8 @@ class ConfigGenerator:
 
             if versions:
                 # Increment patch version
-                from packaging.version import parse
-                latest = max(versions, key=lambda v: parse(v))
+                from ..utils.version_utils import get_latest_version
+                latest = get_latest_version(versions)
                 parts = latest.split('.')
                 try:
                     parts[-1] = str(int(parts[-1]) + 1)
@@ -388,6 +387,8 @@ class ConfigGenerator:
 """
 
         # Write config
+        import yaml
+
         yaml_content += yaml.dump(config, default_flow_style=False, sort_keys=False)
 
         config_path.write_text(yaml_content)
@@ -406,6 +407,8 @@ class ConfigGenerator:
         Returns:
             Configuration dictionary
         """
+        import yaml
+
         with open(config_path, 'r') as f:
             return yaml.safe_load(f)
 
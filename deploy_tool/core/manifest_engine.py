@@ -2,7 +2,6 @@
 """Manifest engine for generating and validating manifest files"""
 
 import hashlib
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -10,6 +9,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from .path_resolver import PathResolver
 from ..constants import MANIFEST_VERSION, PROJECT_CONFIG_FILE
 from ..models.manifest import Manifest, ComponentManifest, FileEntry
+from ..utils.json_utils import load_json_file, save_json_file
 
 
 class ManifestEngine:
@@ -130,11 +130,8 @@ class ManifestEngine:
         # Ensure directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict and save
-        manifest_dict = manifest.to_dict()
-
-        with open(output_path, 'w') as f:
-            json.dump(manifest_dict, f, indent=2, ensure_ascii=False)
+        # The encoder converts the model itself
+        save_json_file(output_path, manifest)
 
         return output_path
 
@@ -157,10 +154,7 @@ class ManifestEngine:
             raise ValidationError(f"Manifest file not found: {manifest_path}")
 
         try:
-            with open(manifest_path, 'r') as f:
-                data = json.load(f)
-
-            return Manifest.from_dict(data)
+            return Manifest.from_dict(load_json_file(manifest_path))
         except Exception as e:
             raise ValidationError(f"Invalid manifest file: {e}")
 
@@ -201,10 +195,15 @@ class ManifestEngine:
         if 'location' in manifest.archive and Path(manifest.archive['location']).is_absolute():
             errors.append("Warning: Archive location is absolute, which may affect portability")
 
-        # Validate archive if provided
-        if archive_path and archive_path.exists():
+        # Validate archive if provided (a single stat covers existence and size)
+        try:
+            archive_stat = archive_path.stat() if archive_path else None
+        except OSError:
+            archive_stat = None
+
+        if archive_stat is not None:
             # Check size
-            actual_size = archive_path.stat().st_size
+            actual_size = archive_stat.st_size
             expected_size = manifest.archive.get('size', 0)
             if actual_size != expected_size:
                 errors.append(
@@ -234,7 +233,7 @@ class ManifestEngine:
         Returns:
             True if signature is valid or not present
         """
-        if 'signature' not in manifest.__dict__ or not manifest.signature:
+        if not manifest.signature:
             # No signature to verify
             return True
 
@@ -1,13 +1,56 @@
 ﻿# deploy_tool/core/path_resolver.py
 """Path resolver - Core component for unified path management"""
 
+import copy
 import os
 import threading
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import Any, Optional, Union, Dict, Tuple
 
-from ..constants import PROJECT_MARKERS, PROJECT_CONFIG_FILE
+from ..constants import (
+    PROJECT_MARKERS,
+    PROJECT_CONFIG_FILE,
+    DEFAULT_DEPLOYMENT_DIR,
+    DEFAULT_MANIFESTS_DIR,
+    DEFAULT_RELEASES_DIR,
+    DEFAULT_CONFIGS_DIR,
+    DEFAULT_DIST_DIR,
+    DEFAULT_CACHE_DIR,
+)
+
+# Parsed project config files, with the (st_mtime_ns, st_size) they were read at
+_config_file_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_project_config_file(config_file: Path) -> Any:
+    """Parse a project config file, reusing the last parse while the file is unchanged
+
+    Every PathResolver and ProjectManager reads the same .deploy-tool.yaml;
+    this parses it once per process (and again only after it is modified).
+
+    Args:
+        config_file: Project configuration file
+
+    Returns:
+        Parsed YAML data (a private copy the caller may modify)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = config_file.stat()
+    file_key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _config_file_cache.get(config_file)
+    if cached is None or cached[0] != file_key:
+        import yaml
+
+        with open(config_file, 'r') as f:
+            cached = (file_key, yaml.safe_load(f))
+        _config_file_cache[config_file] = cached
+
+    return copy.deepcopy(cached[1])
 
 
 class PathType(Enum):
@@ -65,6 +108,7 @@ class PathResolver:
         self._project_root = project_root
         self._cache = ProjectRootCache()
         self._paths_config: Optional[Dict[str, str]] = None
+        self._dirs: Dict[str, Path] = {}  # Resolved project directories by config key
         self._project_found = project_root is not None
         self._find_attempted = False
 
@@ -214,45 +258,27 @@ class PathResolver:
 
     def get_deployment_dir(self) -> Path:
         """Get deployment directory"""
-        from ..constants import DEFAULT_DEPLOYMENT_DIR
-        return self.resolve(
-            self._get_path_config("deployment", DEFAULT_DEPLOYMENT_DIR)
-        )
+        return self._get_dir("deployment", DEFAULT_DEPLOYMENT_DIR)
 
     def get_manifests_dir(self) -> Path:
         """Get manifests directory"""
-        from ..constants import DEFAULT_MANIFESTS_DIR
-        return self.resolve(
-            self._get_path_config("manifests", DEFAULT_MANIFESTS_DIR)
-        )
+        return self._get_dir("manifests", DEFAULT_MANIFESTS_DIR)
 
     def get_releases_dir(self) -> Path:
         """Get releases directory"""
-        from ..constants import DEFAULT_RELEASES_DIR
-        return self.resolve(
-            self._get_path_config("releases", DEFAULT_RELEASES_DIR)
-        )
+        return self._get_dir("releases", DEFAULT_RELEASES_DIR)
 
     def get_configs_dir(self) -> Path:
         """Get package configs directory"""
-        from ..constants import DEFAULT_CONFIGS_DIR
-        return self.resolve(
-            self._get_path_config("configs", DEFAULT_CONFIGS_DIR)
-        )
+        return self._get_dir("configs", DEFAULT_CONFIGS_DIR)
 
     def get_dist_dir(self) -> Path:
         """Get distribution/output directory"""
-        from ..constants import DEFAULT_DIST_DIR
-        return self.resolve(
-            self._get_path_config("dist", DEFAULT_DIST_DIR)
-        )
+        return self._get_dir("dist", DEFAULT_DIST_DIR)
 
     def get_cache_dir(self) -> Path:
         """Get cache directory"""
-        from ..constants import DEFAULT_CACHE_DIR
-        cache_dir = self.resolve(
-            self._get_path_config("cache", DEFAULT_CACHE_DIR)
-        )
+        cache_dir = self._get_dir("cache", DEFAULT_CACHE_DIR)
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
@@ -313,6 +339,22 @@ class PathResolver:
         filename = pattern.format(type=component_type, version=version)
         return self.get_dist_dir() / filename
 
+    def _get_dir(self, key: str, default: str) -> Path:
+        """Get a configured project directory, resolved once per resolver
+
+        Args:
+            key: Configuration key under 'paths'
+            default: Default relative path
+
+        Returns:
+            Resolved directory path
+        """
+        path = self._dirs.get(key)
+        if path is None:
+            path = self.resolve(self._get_path_config(key, default))
+            self._dirs[key] = path
+        return path
+
     def _get_path_config(self, key: str, default: str) -> str:
         """Get path configuration value with safe loading
 
@@ -343,10 +385,8 @@ class PathResolver:
             if self._project_found and self._project_root:
                 config_file = self._project_root / PROJECT_CONFIG_FILE
                 if config_file.exists():
-                    import yaml
-                    with open(config_file, 'r') as f:
-                        config = yaml.safe_load(f)
-                        self._paths_config = config.get('paths', {})
+                    config = load_project_config_file(config_file)
+                    self._paths_config = config.get('paths', {})
         except Exception:
             # Silently ignore errors, use empty config
             pass
@@ -6,19 +6,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-import yaml
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 
-from .path_resolver import PathResolver
+from .path_resolver import PathResolver, load_project_config_file
 from ..api.exceptions import ConfigError, ProjectNotFoundError
 from ..constants import (
     PROJECT_CONFIG_FILE,
     CONFIG_VERSION
 )
+from ..models.codegen import SLOTS
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ProjectConfig:
     """Project configuration data model
 
@@ -74,7 +74,7 @@ class ProjectConfig:
         }
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ValidationResult:
     """Result of project validation"""
     success: bool = True
@@ -85,7 +85,8 @@ class ValidationResult:
     def add_error(self, message: str) -> None:
         """Add error message"""
         self.errors.append(message)
-        self.success = False
+        if self.success:
+            self.success = False
 
     def add_warning(self, message: str) -> None:
         """Add warning message"""
@@ -303,6 +304,8 @@ class ProjectManager:
         if config.paths:
             data['paths'] = config.paths
 
+        import yaml
+
         with open(config_file, 'w') as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
@@ -382,8 +385,7 @@ Thumbs.db
             )
 
         try:
-            with open(config_file, 'r') as f:
-                data = yaml.safe_load(f)
+            data = load_project_config_file(config_file)
 
             # Support both new and old config format
             if 'project' in data:
@@ -3,7 +3,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 
 from ..constants import (
     VERSION_PATTERN,
@@ -14,9 +14,14 @@ from ..constants import (
     RELEASE_VERSION_DATE_PATTERN,
     RELEASE_VERSION_SEMANTIC_PATTERN
 )
+from ..models.codegen import SLOTS
 
+# Required keys of the manifest 'package' and 'archive' sections
+_MANIFEST_PACKAGE_FIELDS = ('type', 'name', 'version', 'created_at')
+_MANIFEST_ARCHIVE_FIELDS = ('filename', 'size', 'checksum')
 
-@dataclass
+
+@dataclass(**SLOTS)
 class ValidationResult:
     """Validation result container"""
     is_valid: bool = True
@@ -27,7 +32,8 @@ class ValidationResult:
     def add_error(self, message: str) -> None:
         """Add error message"""
         self.errors.append(message)
-        self.is_valid = False
+        if self.is_valid:
+            self.is_valid = False
 
     def add_warning(self, message: str) -> None:
         """Add warning message"""
@@ -37,6 +43,21 @@ class ValidationResult:
         """Add info message"""
         self.info.append(message)
 
+    def extend_errors(self, messages: Iterable[str]) -> None:
+        """Add several error messages (invalidates only if any were added)"""
+        count = len(self.errors)
+        self.errors.extend(messages)
+        if self.is_valid and len(self.errors) > count:
+            self.is_valid = False
+
+    def extend_warnings(self, messages: Iterable[str]) -> None:
+        """Add several warning messages"""
+        self.warnings.extend(messages)
+
+    def extend_info(self, messages: Iterable[str]) -> None:
+        """Add several info messages"""
+        self.info.extend(messages)
+
     def add_success(self, message: str) -> None:
         """Add success info message"""
         self.info.append(f"✓ {message}")
@@ -323,18 +344,20 @@ class ValidationEngine:
             result.add_error("Missing package information")
         else:
             package = manifest['package']
-            for field in ['type', 'name', 'version', 'created_at']:
-                if field not in package:
-                    result.add_error(f"Missing package.{field}")
+            result.extend_errors(
+                f"Missing package.{field}"
+                for field in _MANIFEST_PACKAGE_FIELDS if field not in package
+            )
 
         # Check archive info
         if 'archive' not in manifest:
             result.add_error("Missing archive information")
         else:
             archive = manifest['archive']
-            for field in ['filename', 'size', 'checksum']:
-                if field not in archive:
-                    result.add_error(f"Missing archive.{field}")
+            result.extend_errors(
+                f"Missing archive.{field}"
+                for field in _MANIFEST_ARCHIVE_FIELDS if field not in archive
+            )
 
             # Check checksum format
             if 'checksum' in archive and isinstance(archive['checksum'], dict):
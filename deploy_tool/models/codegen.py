@@ -0,0 +1,160 @@
+﻿# deploy_tool/models/codegen.py
+"""Generated to_dict/from_dict methods for flat dataclass models"""
+
+import sys
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List
+
+# Field metadata: leave the key out of to_dict() when the value is falsy
+OMIT_EMPTY = {'omit_empty': True}
+
+# Field metadata: leave the key out of to_dict() when the value is None
+OMIT_NONE = {'omit_none': True}
+
+# dataclass() options for slotted models (slots=True requires Python 3.10+)
+SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class DictModel:
+    """Base for models whose to_dict/from_dict are generated by @dict_methods"""
+
+    __slots__ = ()
+
+    def to_json(self, indent: bool = True) -> bytes:
+        """
+        Encode as UTF-8 JSON (through orjson when installed)
+
+        Args:
+            indent: Pretty-print with 2-space indentation
+
+        Returns:
+            Encoded JSON bytes
+        """
+        # Imported here: deploy_tool.utils imports the models package
+        from ..utils.json_utils import json_dumps
+        return json_dumps(self, indent=indent)
+
+
+def nested(model: type, many: bool = False, **flags: bool) -> Dict[str, Any]:
+    """
+    Field metadata for a field holding another model (or a list of them)
+
+    Args:
+        model: Model class providing to_dict/from_dict
+        many: Field holds a list of models
+        **flags: Other metadata flags (omit_empty, omit_none)
+
+    Returns:
+        Field metadata dict
+    """
+    return {'nested': model, 'many': many, **flags}
+
+
+def _make_function(name: str, lines: List[str], namespace: Dict[str, Any]):
+    """Compile a function from source lines"""
+    source = '\n'.join(lines)
+    exec(compile(source, f'<generated {name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+def dict_methods(cls):
+    """
+    Class decorator generating to_dict/from_dict for a dataclass
+
+    The generated methods are straight-line code built once from
+    dataclasses.fields(cls): to_dict emits every field in declaration
+    order, except fields declared with metadata=OMIT_EMPTY (OMIT_NONE), which
+    are only emitted when truthy (not None). Fields declared with nested()
+    metadata are converted through the nested model's own methods. from_dict
+    reads required fields with data[key] and falls back to the field default
+    (or default factory) otherwise.
+    A to_dict/from_dict defined in the class body itself is kept as is.
+
+    Args:
+        cls: Dataclass to decorate (apply after @dataclass)
+
+    Returns:
+        The same class with to_dict/from_dict installed
+    """
+    namespace: Dict[str, Any] = {}
+    always = []
+    optional = []
+    init_args = []
+
+    for f in fields(cls):
+        name = f.name
+        if name.startswith('_'):
+            continue
+
+        model = f.metadata.get('nested')
+        many = f.metadata.get('many', False)
+        if model is None:
+            value = f'self.{name}'
+        elif many:
+            value = f'[v.to_dict() for v in self.{name}]'
+        else:
+            value = f'self.{name}.to_dict()'
+
+        if f.metadata.get('omit_empty'):
+            optional.append((f'self.{name}', name, value))
+        elif f.metadata.get('omit_none'):
+            optional.append((f'self.{name} is not None', name, value))
+        else:
+            always.append((name, value))
+
+        if not f.init:
+            continue
+
+        key = repr(name)
+        raw = f'data[{key}]'
+        if model is not None:
+            namespace[f'_model_{name}'] = model
+            if many:
+                raw = f'[_model_{name}.from_dict(v) for v in {raw}]'
+            else:
+                raw = f'_model_{name}.from_dict({raw})'
+
+        if f.default is not MISSING:
+            namespace[f'_default_{name}'] = f.default
+            fallback = f'_default_{name}'
+        elif f.default_factory is not MISSING:
+            namespace[f'_factory_{name}'] = f.default_factory
+            fallback = f'_factory_{name}()'
+        else:
+            fallback = None
+
+        if fallback is None:
+            value = raw
+        elif model is not None:
+            value = f'{raw} if data.get({key}) is not None else {fallback}'
+        elif f.default is not MISSING:
+            value = f'data.get({key}, {fallback})'
+        else:
+            value = f'{raw} if {key} in data else {fallback}'
+        init_args.append(f'        {name}={value},')
+
+    # to_dict
+    lines = ['def to_dict(self):', '    data = {']
+    lines += [f'        {name!r}: {value},' for name, value in always]
+    lines.append('    }')
+    for condition, name, value in optional:
+        lines.append(f'    if {condition}:')
+        lines.append(f'        data[{name!r}] = {value}')
+    lines.append('    return data')
+    to_dict = _make_function('to_dict', lines, namespace)
+    to_dict.__doc__ = "Convert to dictionary"
+    to_dict.__qualname__ = f'{cls.__qualname__}.to_dict'
+
+    # from_dict
+    lines = ['def from_dict(cls, data):', '    return cls(']
+    lines += init_args
+    lines.append('    )')
+    from_dict = _make_function('from_dict', lines, namespace)
+    from_dict.__doc__ = "Create from dictionary"
+    from_dict.__qualname__ = f'{cls.__qualname__}.from_dict'
+
+    if 'to_dict' not in cls.__dict__:
+        cls.to_dict = to_dict
+    if 'from_dict' not in cls.__dict__:
+        cls.from_dict = classmethod(from_dict)
+    return cls
@@ -1,130 +1,79 @@
 ﻿# deploy_tool/models/config.py
 """Configuration models"""
 
+import re
+import string
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
-
+from .codegen import DictModel, OMIT_EMPTY, dict_methods
+
+# Compression algorithm -> archive extension
+_COMPRESSION_EXTENSIONS = {
+    'gzip': '.gz',
+    'gz': '.gz',
+    'bzip2': '.bz2',
+    'bz2': '.bz2',
+    'xz': '.xz',
+    'lzma': '.xz',
+    'lz4': '.lz4',
+    'none': '',
+    '': ''
+}
+
+# Size string such as "10MB" or "1.5 GB"
+_SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B)?$')
+
+# Size unit -> bytes multiplier
+_SIZE_UNITS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024,
+    'TB': 1024 * 1024 * 1024 * 1024
+}
+
+
+@dict_methods
 @dataclass
-class PackageConfig:
+class PackageConfig(DictModel):
     """Package configuration"""
     type: str  # Package type (user-defined)
     version: str  # Version string
-    name: Optional[str] = None  # Package name
-    description: Optional[str] = None  # Package description
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'type': self.type,
-            'version': self.version
-        }
-
-        if self.name:
-            data['name'] = self.name
-        if self.description:
-            data['description'] = self.description
-
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PackageConfig':
-        """Create from dictionary"""
-        return cls(
-            type=data['type'],
-            version=data['version'],
-            name=data.get('name'),
-            description=data.get('description')
-        )
+    name: Optional[str] = field(default=None, metadata=OMIT_EMPTY)  # Package name
+    description: Optional[str] = field(default=None, metadata=OMIT_EMPTY)  # Package description
 
 
+@dict_methods
 @dataclass
-class SourceConfig:
+class SourceConfig(DictModel):
     """Source configuration"""
     path: str  # Source path
     includes: List[str] = field(default_factory=lambda: ['*'])
     excludes: List[str] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'path': self.path,
-            'includes': self.includes,
-            'excludes': self.excludes
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'SourceConfig':
-        """Create from dictionary"""
-        return cls(
-            path=data['path'],
-            includes=data.get('includes', ['*']),
-            excludes=data.get('excludes', [])
-        )
-
 
+@dict_methods
 @dataclass
-class CompressionConfig:
+class CompressionConfig(DictModel):
     """Compression configuration"""
     algorithm: str = 'gzip'  # Compression algorithm
     level: int = 6  # Compression level
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'algorithm': self.algorithm,
-            'level': self.level
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'CompressionConfig':
-        """Create from dictionary"""
-        return cls(
-            algorithm=data.get('algorithm', 'gzip'),
-            level=data.get('level', 6)
-        )
-
     def get_extension(self) -> str:
         """Get compression extension"""
-        extensions = {
-            'gzip': '.gz',
-            'gz': '.gz',
-            'bzip2': '.bz2',
-            'bz2': '.bz2',
-            'xz': '.xz',
-            'lzma': '.xz',
-            'lz4': '.lz4',
-            'none': '',
-            '': ''
-        }
-        return extensions.get(self.algorithm.lower(), '.gz')
+        return _COMPRESSION_EXTENSIONS.get(self.algorithm.lower(), '.gz')
 
 
+@dict_methods
 @dataclass
-class OutputConfig:
+class OutputConfig(DictModel):
     """Output configuration"""
     filename: str = '${package.type}-${package.version}.tar${compression.extension}'
     path: str = './dist/'
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'filename': self.filename,
-            'path': self.path
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'OutputConfig':
-        """Create from dictionary"""
-        return cls(
-            filename=data.get('filename', '${package.type}-${package.version}.tar${compression.extension}'),
-            path=data.get('path', './dist/')
-        )
-
     def format_filename(self, package: PackageConfig, compression: CompressionConfig) -> str:
         """Format output filename with substitutions"""
-        import string
-
         # Create substitution mapping
         mapping = {
             'package.type': package.type,
@@ -138,34 +87,13 @@ class OutputConfig:
         return template.safe_substitute(mapping)
 
 
+@dict_methods
 @dataclass
-class ValidationConfig:
+class ValidationConfig(DictModel):
     """Validation configuration"""
     checksum: List[str] = field(default_factory=lambda: ['sha256'])
-    min_size: Optional[str] = None
-    max_size: Optional[str] = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'checksum': self.checksum
-        }
-
-        if self.min_size:
-            data['min_size'] = self.min_size
-        if self.max_size:
-            data['max_size'] = self.max_size
-
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationConfig':
-        """Create from dictionary"""
-        return cls(
-            checksum=data.get('checksum', ['sha256']),
-            min_size=data.get('min_size'),
-            max_size=data.get('max_size')
-        )
+    min_size: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    max_size: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
 
     def get_min_size_bytes(self) -> Optional[int]:
         """Get minimum size in bytes"""
@@ -181,8 +109,7 @@ class ValidationConfig:
         size_str = size_str.strip().upper()
 
         # Extract number and unit
-        import re
-        match = re.match(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B)?$', size_str)
+        match = _SIZE_PATTERN.match(size_str)
         if not match:
             raise ValueError(f"Invalid size format: {size_str}")
 
@@ -190,15 +117,13 @@ class ValidationConfig:
         unit = match.group(2) or 'B'
 
         # Convert to bytes
-        units = {
-            'B': 1,
-            'KB': 1024,
-            'MB': 1024 * 1024,
-            'GB': 1024 * 1024 * 1024,
-            'TB': 1024 * 1024 * 1024 * 1024
-        }
+        return int(number * _SIZE_UNITS.get(unit, 1))
+
 
-        return int(number * units.get(unit, 1))
+# Serialized form of default sub-configs, omitted from FullConfig.to_dict
+_DEFAULT_COMPRESSION_DICT = CompressionConfig().to_dict()
+_DEFAULT_OUTPUT_DICT = OutputConfig().to_dict()
+_DEFAULT_VALIDATION_DICT = ValidationConfig().to_dict()
 
 
 @dataclass
@@ -215,12 +140,20 @@ class FullConfig:
         """Convert to dictionary"""
         data = {
             'package': self.package.to_dict(),
-            'source': self.source.to_dict(),
-            'compression': self.compression.to_dict(),
-            'output': self.output.to_dict(),
-            'validation': self.validation.to_dict()
+            'source': self.source.to_dict()
         }
 
+        # Sections left at their defaults are restored by from_dict
+        compression = self.compression.to_dict()
+        if compression != _DEFAULT_COMPRESSION_DICT:
+            data['compression'] = compression
+        output = self.output.to_dict()
+        if output != _DEFAULT_OUTPUT_DICT:
+            data['output'] = output
+        validation = self.validation.to_dict()
+        if validation != _DEFAULT_VALIDATION_DICT:
+            data['validation'] = validation
+
         if self.metadata:
             data['metadata'] = self.metadata
 
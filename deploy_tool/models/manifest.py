@@ -1,142 +1,62 @@
 ﻿# deploy_tool/models/manifest.py
 """Manifest models"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
+from .codegen import SLOTS, DictModel, OMIT_EMPTY, dict_methods, nested
 
-@dataclass
-class FileEntry:
+
+@dict_methods
+@dataclass(**SLOTS)
+class FileEntry(DictModel):
     """File entry in manifest"""
     path: str  # File path (relative)
     size: int  # File size in bytes
-    checksum: Optional[str] = None  # File checksum
+    checksum: Optional[str] = field(default=None, metadata=OMIT_EMPTY)  # File checksum
     is_dir: bool = False  # Is directory
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'path': self.path,
-            'size': self.size,
-            'is_dir': self.is_dir
-        }
-        if self.checksum:
-            data['checksum'] = self.checksum
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'FileEntry':
-        """Create from dictionary"""
-        return cls(
-            path=data['path'],
-            size=data['size'],
-            checksum=data.get('checksum'),
-            is_dir=data.get('is_dir', False)
-        )
-
-
-@dataclass
-class Manifest:
+
+@dict_methods
+@dataclass(**SLOTS)
+class Manifest(DictModel):
     """Component manifest"""
     manifest_version: str
     project: Dict[str, str]
     package: Dict[str, Any]
     archive: Dict[str, Any]
     build: Dict[str, Any]
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    signature: Optional[str] = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'manifest_version': self.manifest_version,
-            'project': self.project,
-            'package': self.package,
-            'archive': self.archive,
-            'build': self.build
-        }
-
-        if self.metadata:
-            data['metadata'] = self.metadata
-
-        if self.signature:
-            data['signature'] = self.signature
-
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Manifest':
-        """Create from dictionary"""
-        return cls(
-            manifest_version=data['manifest_version'],
-            project=data['project'],
-            package=data['package'],
-            archive=data['archive'],
-            build=data['build'],
-            metadata=data.get('metadata', {}),
-            signature=data.get('signature')
-        )
+    metadata: Dict[str, Any] = field(default_factory=dict, metadata=OMIT_EMPTY)
+    signature: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
 
     def get_component_key(self) -> str:
         """Get component key (type:version)"""
         return f"{self.package['type']}:{self.package['version']}"
 
 
-@dataclass
-class ComponentRef:
+@dict_methods
+@dataclass(**SLOTS)
+class ComponentRef(DictModel):
     """Component reference in release manifest"""
     type: str
     version: str
     manifest: str  # Manifest file path
 
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to dictionary"""
-        return {
-            'type': self.type,
-            'version': self.version,
-            'manifest': self.manifest
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, str]) -> 'ComponentRef':
-        """Create from dictionary"""
-        return cls(
-            type=data['type'],
-            version=data['version'],
-            manifest=data['manifest']
-        )
-
-
-@dataclass
-class ReleaseManifest:
+    def __post_init__(self):
+        # Component types come from a small set; share one string per type
+        if isinstance(self.type, str):
+            self.type = sys.intern(self.type)
+
+
+@dict_methods
+@dataclass(**SLOTS)
+class ReleaseManifest(DictModel):
     """Release manifest containing multiple components"""
     manifest_version: str
     release: Dict[str, Any]
-    components: List[ComponentRef]
-    metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'manifest_version': self.manifest_version,
-            'release': self.release,
-            'components': [c.to_dict() for c in self.components]
-        }
-
-        if self.metadata:
-            data['metadata'] = self.metadata
-
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ReleaseManifest':
-        """Create from dictionary"""
-        return cls(
-            manifest_version=data['manifest_version'],
-            release=data['release'],
-            components=[ComponentRef.from_dict(c) for c in data['components']],
-            metadata=data.get('metadata', {})
-        )
+    components: List[ComponentRef] = field(metadata=nested(ComponentRef, many=True))
+    metadata: Dict[str, Any] = field(default_factory=dict, metadata=OMIT_EMPTY)
 
     def get_component_count(self) -> int:
         """Get number of components"""
@@ -154,33 +74,11 @@ class ReleaseManifest:
         return None
 
 
-@dataclass
-class ComponentManifest:
+@dict_methods
+@dataclass(**SLOTS)
+class ComponentManifest(DictModel):
     """Detailed component manifest with file listing"""
     manifest_version: str
     component: Dict[str, Any]
     files: List[Dict[str, Any]]
-    metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'manifest_version': self.manifest_version,
-            'component': self.component,
-            'files': self.files
-        }
-
-        if self.metadata:
-            data['metadata'] = self.metadata
-
-        return data
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ComponentManifest':
-        """Create from dictionary"""
-        return cls(
-            manifest_version=data['manifest_version'],
-            component=data['component'],
-            files=data['files'],
-            metadata=data.get('metadata', {})
-        )
\ No newline at end of file
+    metadata: Dict[str, Any] = field(default_factory=dict, metadata=OMIT_EMPTY)
@@ -2,12 +2,17 @@
 """Release models for the deployment tool"""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
 from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from .codegen import SLOTS, DictModel, dict_methods
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
-@dataclass
-class ReleaseManifest:
+@dict_methods
+@dataclass(**SLOTS)
+class ReleaseManifest(DictModel):
     """Release manifest containing multiple components"""
     release_version: str
     release_name: Optional[str] = None
@@ -19,29 +24,8 @@ class ReleaseManifest:
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            'release_version': self.release_version,
-            'release_name': self.release_name,
-            'created_at': self.created_at,
-            'components': self.components,
-            'metadata': self.metadata
-        }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ReleaseManifest':
-        """Create from dictionary"""
-        return cls(
-            release_version=data['release_version'],
-            release_name=data.get('release_name'),
-            created_at=data.get('created_at'),
-            components=data.get('components', []),
-            metadata=data.get('metadata', {})
-        )
-
-
-@dataclass
+@dataclass(**SLOTS)
 class PublishResult:
     """Result of a publish operation"""
     success: bool
@@ -54,7 +38,7 @@ class PublishResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class DeployResult:
     """Result of a deployment operation"""
     success: bool
@@ -68,8 +52,9 @@ class DeployResult:
     verification: Optional[Dict[str, Any]] = None
 
 
-@dataclass
-class DeploymentState:
+@dict_methods
+@dataclass(**SLOTS)
+class DeploymentState(DictModel):
     """Current deployment state"""
     release_version: str
     deployed_at: str
@@ -79,18 +64,6 @@ class DeploymentState:
     previous_version: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'release_version': self.release_version,
-            'deployed_at': self.deployed_at,
-            'target_dir': self.target_dir,
-            'components': self.components,
-            'symlinks': self.symlinks,
-            'previous_version': self.previous_version,
-            'metadata': self.metadata
-        }
-
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DeploymentState':
         """Create from dictionary"""
@@ -105,7 +78,7 @@ class DeploymentState:
         )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ReleaseInfo:
     """Information about a release"""
     version: str
@@ -117,12 +90,13 @@ class ReleaseInfo:
 
     def format_size(self) -> str:
         """Format size in human-readable form"""
-        if self.total_size is None:
+        size = self.total_size
+        if size is None:
             return "Unknown"
 
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if self.total_size < 1024:
-                return f"{self.total_size:.1f} {unit}"
-            self.total_size /= 1024
+        # Each unit step is 10 bits; pick the unit directly from the bit length
+        exponent = 0
+        if size >= 1024:
+            exponent = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-        return f"{self.total_size:.1f} TB"
\ No newline at end of file
+        return f"{size / (1 << (10 * exponent)):.1f} {_SIZE_UNITS[exponent]}"
\ No newline at end of file
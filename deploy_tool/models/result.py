@@ -1,136 +1,63 @@
 ﻿# deploy_tool/models/result.py
 """Result models for deploy-tool operations"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+from .codegen import SLOTS, DictModel, OMIT_EMPTY, OMIT_NONE, dict_methods, nested
 from .component import Component
 
 
-@dataclass
-class PackResult:
+@dict_methods
+@dataclass(**SLOTS)
+class PackResult(DictModel):
     """Pack operation result"""
     success: bool
     package_type: str
     version: str
-    manifest_path: Optional[str] = None
-    archive_path: Optional[str] = None
-    archive_size: Optional[int] = None
-    config_path: Optional[str] = None
-    error: Optional[str] = None
+    manifest_path: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    archive_path: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    archive_size: Optional[int] = field(default=None, metadata=OMIT_NONE)
+    config_path: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    error: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
     duration: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
     git_suggestions: List[str] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'success': self.success,
-            'package_type': self.package_type,
-            'version': self.version,
-            'duration': self.duration,
-            'metadata': self.metadata,
-            'git_suggestions': self.git_suggestions
-        }
+    def __post_init__(self):
+        # Package types come from a small set; share one string per type
+        if isinstance(self.package_type, str):
+            self.package_type = sys.intern(self.package_type)
 
-        if self.manifest_path:
-            data['manifest_path'] = self.manifest_path
-        if self.archive_path:
-            data['archive_path'] = self.archive_path
-        if self.archive_size is not None:
-            data['archive_size'] = self.archive_size
-        if self.config_path:
-            data['config_path'] = self.config_path
-        if self.error:
-            data['error'] = self.error
 
-        return data
-
-
-@dataclass
-class ComponentPublishResult:
+@dict_methods
+@dataclass(**SLOTS)
+class ComponentPublishResult(DictModel):
     """Single component publish result"""
-    component: Component
+    component: Component = field(metadata=nested(Component))
     success: bool
     storage_path: str
-    error: Optional[str] = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'component': self.component.to_dict(),
-            'success': self.success,
-            'storage_path': self.storage_path
-        }
-
-        if self.error:
-            data['error'] = self.error
+    error: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
 
-        return data
 
-
-@dataclass
-class PublishResult:
+@dict_methods
+@dataclass(**SLOTS)
+class PublishResult(DictModel):
     """Publish operation result"""
     success: bool
-    release_version: Optional[str] = None
-    release_manifest: Optional[str] = None
-    components: List[ComponentPublishResult] = field(default_factory=list)
-    error: Optional[str] = None
+    release_version: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    release_manifest: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    components: List[ComponentPublishResult] = field(
+        default_factory=list, metadata=nested(ComponentPublishResult, many=True)
+    )
+    error: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
     duration: float = 0.0
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'success': self.success,
-            'duration': self.duration,
-            'components': [c.to_dict() for c in self.components]
-        }
-
-        if self.release_version:
-            data['release_version'] = self.release_version
-        if self.release_manifest:
-            data['release_manifest'] = self.release_manifest
-        if self.error:
-            data['error'] = self.error
-
-        return data
 
-
-@dataclass
-class DeployResult:
-    """Deployment operation result"""
-    success: bool
-    deploy_type: str  # "release" or "component"
-    deploy_target: str
-    deployed_components: List[Component] = field(default_factory=list)
-    error: Optional[str] = None
-    duration: float = 0.0
-    verification: Optional['VerifyResult'] = None
-    rollback_available: bool = False
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'success': self.success,
-            'deploy_type': self.deploy_type,
-            'deploy_target': self.deploy_target,
-            'duration': self.duration,
-            'rollback_available': self.rollback_available,
-            'deployed_components': [c.to_dict() for c in self.deployed_components]
-        }
-
-        if self.error:
-            data['error'] = self.error
-
-        if self.verification:
-            data['verification'] = self.verification.to_dict()
-
-        return data
-
-
-@dataclass
-class VerifyResult:
+@dict_methods
+@dataclass(**SLOTS)
+class VerifyResult(DictModel):
     """Verification operation result"""
     success: bool
     component_type: str
@@ -139,21 +66,30 @@ class VerifyResult:
     files_complete: bool = False
     manifest_valid: bool = False
     issues: List[str] = field(default_factory=list)
-    error: Optional[str] = None
+    error: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+
+    def __post_init__(self):
+        if isinstance(self.component_type, str):
+            self.component_type = sys.intern(self.component_type)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = {
-            'success': self.success,
-            'component_type': self.component_type,
-            'version': self.version,
-            'checksum_valid': self.checksum_valid,
-            'files_complete': self.files_complete,
-            'manifest_valid': self.manifest_valid,
-            'issues': self.issues
-        }
 
-        if self.error:
-            data['error'] = self.error
+@dict_methods
+@dataclass(**SLOTS)
+class DeployResult(DictModel):
+    """Deployment operation result"""
+    success: bool
+    deploy_type: str  # "release" or "component"
+    deploy_target: str
+    deployed_components: List[Component] = field(
+        default_factory=list, metadata=nested(Component, many=True)
+    )
+    error: Optional[str] = field(default=None, metadata=OMIT_EMPTY)
+    duration: float = 0.0
+    verification: Optional[VerifyResult] = field(
+        default=None, metadata=nested(VerifyResult, omit_empty=True)
+    )
+    rollback_available: bool = False
 
-        return data
\ No newline at end of file
+    def __post_init__(self):
+        if isinstance(self.deploy_type, str):
+            self.deploy_type = sys.intern(self.deploy_type)
@@ -1,14 +1,19 @@
 ﻿# deploy_tool/plugins/base.py
 """Plugin system base classes and manager"""
 
+import bisect
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List, Any, Optional
+from enum import Enum, IntEnum
+from functools import cached_property
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple
 
+from ..models.codegen import SLOTS
 
-class PluginPriority(Enum):
+
+class PluginPriority(IntEnum):
     """Plugin execution priority"""
     HIGHEST = 0
     HIGH = 25
@@ -17,7 +22,7 @@ class PluginPriority(Enum):
     LOWEST = 100
 
 
-class HookPoint(Enum):
+class HookPoint(str, Enum):
     """Available hook points in the deployment lifecycle"""
     # Project lifecycle
     PROJECT_INIT_PRE = "project.init.pre"
@@ -53,8 +58,13 @@ class HookPoint(Enum):
     STORAGE_DOWNLOAD_PRE = "storage.download.pre"
     STORAGE_DOWNLOAD_POST = "storage.download.post"
 
+    @cached_property
+    def handler_name(self) -> str:
+        """Name of the Plugin method handling this hook (e.g. on_pack_pre)"""
+        return "on_" + self.value.replace('.', '_')
+
 
-@dataclass
+@dataclass(**SLOTS)
 class PluginContext:
     """Context passed to plugin hooks"""
     hook_point: HookPoint
@@ -77,7 +87,7 @@ class PluginContext:
         return len(self.errors) > 0
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PluginInfo:
     """Plugin metadata"""
     name: str
@@ -94,6 +104,12 @@ class PluginInfo:
 class Plugin(ABC):
     """Base class for all plugins"""
 
+    # on_<hook> handler methods by hook point, resolved on the first hook call.
+    # A class default so subclasses that skip super().__init__() still work
+    _handlers: Optional[Dict[HookPoint, Callable[[PluginContext], Awaitable[PluginContext]]]] = None
+    # get_info() result, cached on first access of info (same reason)
+    _info: Optional[PluginInfo] = None
+
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize plugin
@@ -109,6 +125,13 @@ class Plugin(ABC):
         """Get plugin information"""
         pass
 
+    @property
+    def info(self) -> PluginInfo:
+        """Plugin information, built by get_info() once per instance"""
+        if self._info is None:
+            self._info = self.get_info()
+        return self._info
+
     async def initialize(self) -> None:
         """Initialize plugin (optional)"""
         pass
@@ -127,12 +150,17 @@ class Plugin(ABC):
         Returns:
             Modified context
         """
-        hook_point = context.hook_point
-        handler_name = f"on_{hook_point.value.replace('.', '_')}"
-
-        # Look for specific handler method
-        handler = getattr(self, handler_name, None)
-        if handler and callable(handler):
+        # Look for specific handler method (resolved once per instance)
+        handlers = self._handlers
+        if handlers is None:
+            handlers = self._handlers = {}
+            for hook_point in HookPoint:
+                handler = getattr(self, hook_point.handler_name, None)
+                if callable(handler):
+                    handlers[hook_point] = handler
+
+        handler = handlers.get(context.hook_point)
+        if handler is not None:
             return await handler(context)
 
         return context
@@ -143,7 +171,9 @@ class PluginManager:
 
     def __init__(self):
         self._plugins: Dict[str, Plugin] = {}
-        self._hooks: Dict[HookPoint, List[Plugin]] = {hp: [] for hp in HookPoint}
+        # Per hook: (priority, registration order, plugin), kept sorted on insert
+        self._hooks: Dict[HookPoint, List[Tuple[int, int, Plugin]]] = {hp: [] for hp in HookPoint}
+        self._order = itertools.count()
         self.logger = logging.getLogger("PluginManager")
 
     def register(self, plugin: Plugin) -> None:
@@ -153,23 +183,20 @@ class PluginManager:
         Args:
             plugin: Plugin instance
         """
-        info = plugin.get_info()
+        info = plugin.info
 
         if info.name in self._plugins:
-            self.logger.warning(f"Plugin {info.name} already registered, replacing")
+            self.logger.warning("Plugin %s already registered, replacing", info.name)
 
         self._plugins[info.name] = plugin
 
-        # Register hooks
+        # Register hooks, keeping each list sorted by priority (stable for ties)
+        entry = (info.priority.value, next(self._order), plugin)
         for hook_point in info.hook_points:
             if hook_point in self._hooks:
-                self._hooks[hook_point].append(plugin)
-                # Sort by priority
-                self._hooks[hook_point].sort(
-                    key=lambda p: p.get_info().priority.value
-                )
+                bisect.insort(self._hooks[hook_point], entry)
 
-        self.logger.info(f"Registered plugin: {info.name} v{info.version}")
+        self.logger.info("Registered plugin: %s v%s", info.name, info.version)
 
     def unregister(self, plugin_name: str) -> None:
         """
@@ -186,10 +213,9 @@ class PluginManager:
 
         # Remove from hooks
         for hook_list in self._hooks.values():
-            if plugin in hook_list:
-                hook_list.remove(plugin)
+            hook_list[:] = [entry for entry in hook_list if entry[2] is not plugin]
 
-        self.logger.info(f"Unregistered plugin: {plugin_name}")
+        self.logger.info("Unregistered plugin: %s", plugin_name)
 
     async def initialize_all(self) -> None:
         """Initialize all registered plugins"""
@@ -197,7 +223,7 @@ class PluginManager:
             try:
                 await plugin.initialize()
             except Exception as e:
-                self.logger.error(f"Failed to initialize plugin {plugin.get_info().name}: {e}")
+                self.logger.error("Failed to initialize plugin %s: %s", plugin.info.name, e)
 
     async def cleanup_all(self) -> None:
         """Cleanup all registered plugins"""
@@ -205,7 +231,7 @@ class PluginManager:
             try:
                 await plugin.cleanup()
             except Exception as e:
-                self.logger.error(f"Failed to cleanup plugin {plugin.get_info().name}: {e}")
+                self.logger.error("Failed to cleanup plugin %s: %s", plugin.info.name, e)
 
     async def execute_hook(self,
                            hook_point: HookPoint,
@@ -220,28 +246,31 @@ class PluginManager:
         Returns:
             Modified context after all plugins
         """
-        if hook_point not in self._hooks:
+        plugins = self._hooks.get(hook_point)
+        if not plugins:
             return context
 
-        plugins = self._hooks[hook_point]
+        # Checked once per hook so disabled debug logging builds no messages
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        for plugin in plugins:
-            info = plugin.get_info()
+        for _, _, plugin in plugins:
+            info = plugin.info
 
             if not info.enabled:
                 continue
 
             try:
-                self.logger.debug(f"Executing plugin {info.name} for {hook_point.value}")
+                if debug:
+                    self.logger.debug("Executing plugin %s for %s", info.name, hook_point.value)
                 context = await plugin.handle_hook(context)
 
                 # Stop if errors occurred and plugin has high priority
-                if context.has_errors() and info.priority.value <= PluginPriority.HIGH.value:
-                    self.logger.warning(f"Plugin {info.name} reported errors, stopping hook execution")
+                if context.has_errors() and info.priority <= PluginPriority.HIGH:
+                    self.logger.warning("Plugin %s reported errors, stopping hook execution", info.name)
                     break
 
             except Exception as e:
-                self.logger.error(f"Plugin {info.name} failed: {e}")
+                self.logger.error("Plugin %s failed: %s", info.name, e)
                 context.add_error(f"Plugin {info.name} error: {str(e)}")
 
         return context
@@ -252,17 +281,17 @@ class PluginManager:
 
     def list_plugins(self) -> List[PluginInfo]:
         """List all registered plugins"""
-        return [p.get_info() for p in self._plugins.values()]
+        return [p.info for p in self._plugins.values()]
 
     def enable_plugin(self, name: str) -> None:
         """Enable a plugin"""
         if name in self._plugins:
-            self._plugins[name].get_info().enabled = True
+            self._plugins[name].info.enabled = True
 
     def disable_plugin(self, name: str) -> None:
         """Disable a plugin"""
         if name in self._plugins:
-            self._plugins[name].get_info().enabled = False
+            self._plugins[name].info.enabled = False
 
 
 # Global plugin manager instance
@@ -1,14 +1,87 @@
 ﻿# deploy_tool/plugins/builtin/cache.py
 """Caching plugin for deployment operations"""
 
+import hashlib
+import heapq
+import itertools
 import json
+import os
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from ..base import Plugin, PluginInfo, PluginContext, PluginPriority, HookPoint
 from ...constants import DEFAULT_CACHE_DIR
+from ...utils.async_utils import sync_to_async
+from ...utils.file_utils import atomic_write, clone_file
 from ...utils.hash_utils import calculate_directory_hash, calculate_file_hash
+from ...utils.json_utils import json_dumps, load_json_file
+
+# Hashing reads whole files and trees; run it in the default executor off the event loop
+_hash_directory = sync_to_async(calculate_directory_hash)
+_hash_file = sync_to_async(calculate_file_hash)
+
+# Metadata snapshots are numbered in the order they are taken (on the event loop)
+_snapshot_counter = itertools.count(1)
+# Per metadata file: [lock, number of the newest snapshot written]
+_metadata_writes: Dict[str, list] = {}
+_metadata_writes_lock = threading.Lock()
+
+
+@sync_to_async
+def _write_metadata(file_path: Path, snapshot: int, data: bytes) -> None:
+    """Write a metadata snapshot unless a newer one of the same file landed first"""
+    # Executor threads may run writes out of order; an older snapshot must
+    # never replace a newer one
+    with _metadata_writes_lock:
+        state = _metadata_writes.setdefault(str(file_path), [threading.Lock(), 0])
+
+    with state[0]:
+        if snapshot > state[1]:
+            atomic_write(file_path, data, mode='wb')
+            state[1] = snapshot
+
+
+def _stat_fingerprint(path: Path) -> str:
+    """Fingerprint a file or tree from (relative path, size, mtime_ns) of every file"""
+    if not path.is_dir():
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    files = []
+    pending = [(str(path), '')]
+    while pending:
+        dir_path, prefix = pending.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, rel_path + '/'))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files.append((rel_path, stat.st_size, stat.st_mtime_ns))
+
+    files.sort()
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for rel_path, size, mtime_ns in files:
+        fingerprint.update(f"{rel_path}\0{size}\0{mtime_ns}\0".encode('utf-8', 'surrogateescape'))
+    return fingerprint.hexdigest()
+
+
+# Only stats files, but still one call per file; keep it off the event loop too
+_quick_fingerprint = sync_to_async(_stat_fingerprint)
+
+
+@lru_cache(maxsize=1024)
+def _compute_key(operation: str, params: Tuple[Tuple[str, Any], ...]) -> str:
+    """Hash sorted operation params into a cache key (cached, pre and post hooks repeat them)"""
+    # Canonical JSON hashed with BLAKE2b: unlike hash(), the key is the same
+    # in every process (str hashing is randomized per interpreter run)
+    param_bytes = json.dumps(dict(params), separators=(',', ':')).encode('utf-8')
+    return f"{operation}:{hashlib.blake2b(param_bytes, digest_size=16).hexdigest()}"
 
 
 class CachePlugin(Plugin):
@@ -50,36 +123,46 @@ class CachePlugin(Plugin):
         # Load or create metadata
         if self.cache_metadata_file.exists():
             try:
-                with open(self.cache_metadata_file, 'r') as f:
-                    self.cache_metadata = json.load(f)
+                self.cache_metadata = load_json_file(self.cache_metadata_file)
             except:
                 self.cache_metadata = {}
         else:
             self.cache_metadata = {}
 
-    def _save_metadata(self) -> None:
+        # Older metadata stored ISO timestamps; convert them to epoch seconds once
+        for cache_entry in self.cache_metadata.values():
+            timestamp = cache_entry.get('timestamp')
+            if isinstance(timestamp, str):
+                try:
+                    cache_entry['timestamp'] = datetime.fromisoformat(timestamp).timestamp()
+                except ValueError:
+                    del cache_entry['timestamp']
+
+    async def _save_metadata(self) -> None:
         """Save cache metadata"""
         try:
-            with open(self.cache_metadata_file, 'w') as f:
-                json.dump(self.cache_metadata, f, indent=2)
+            # Serialize on the loop (a consistent snapshot), write in the executor;
+            # write-then-rename so an interrupted save cannot corrupt the metadata
+            snapshot = next(_snapshot_counter)
+            await _write_metadata(self.cache_metadata_file, snapshot, json_dumps(self.cache_metadata))
         except Exception as e:
             self.logger.warning(f"Failed to save cache metadata: {e}")
 
     def _get_cache_key(self, operation: str, params: Dict[str, Any]) -> str:
-        """Generate cache key from operation and parameters"""
-        # Create a stable string representation
-        param_str = json.dumps(params, sort_keys=True)
-        return f"{operation}:{hash(param_str)}"
+        """Generate cache key from operation and (hashable) parameter values"""
+        return _compute_key(operation, tuple(sorted(params.items())))
+
+    def _get_download_key(self, checksum: str) -> str:
+        """Get cache key of a downloaded file (the checksum is already stable)"""
+        return f"download:{checksum}"
 
     def _is_cache_valid(self, cache_entry: Dict[str, Any]) -> bool:
         """Check if cache entry is still valid"""
-        if 'timestamp' not in cache_entry:
+        timestamp = cache_entry.get('timestamp')
+        if timestamp is None:
             return False
 
-        created = datetime.fromisoformat(cache_entry['timestamp'])
-        age = datetime.now() - created
-
-        return age.total_seconds() < self.ttl_seconds
+        return time.time() - timestamp < self.ttl_seconds
 
     async def on_pack_pre(self, context: PluginContext) -> PluginContext:
         """Check cache before packing"""
@@ -87,15 +170,37 @@ class CachePlugin(Plugin):
         package_type = context.data.get('package_type')
         version = context.data.get('version')
 
-        if not all([source_path, package_type, version]):
+        if not (source_path and package_type and version):
             return context
 
-        # Calculate source hash
+        # Reuse the last content hash while no file changed size or mtime
         source_path = Path(source_path)
-        if source_path.is_dir():
-            source_hash = await calculate_directory_hash(source_path)
+        quick_fp = await _quick_fingerprint(source_path)
+        source_key = self._get_cache_key('source', {
+            'type': package_type,
+            'version': version,
+            'path': str(source_path.resolve())
+        })
+        source_entry = self.cache_metadata.get(source_key)
+
+        if (source_entry and self._is_cache_valid(source_entry)
+                and source_entry.get('quick_fp') == quick_fp):
+            # Reused as is; the entry expires ttl_seconds after hashing
+            source_hash = source_entry['source_hash']
+            new_fingerprint = False
         else:
-            source_hash = calculate_file_hash(source_path)
+            if source_path.is_dir():
+                source_hash = await _hash_directory(source_path)
+            else:
+                source_hash = await _hash_file(source_path)
+
+            # Saved with on_pack_post's metadata write (or below on a cache hit)
+            self.cache_metadata[source_key] = {
+                'quick_fp': quick_fp,
+                'source_hash': source_hash,
+                'timestamp': time.time()
+            }
+            new_fingerprint = True
 
         # Check cache
         cache_key = self._get_cache_key('pack', {
@@ -119,6 +224,10 @@ class CachePlugin(Plugin):
                     # Skip packing by adding special flag
                     context.data['skip_pack'] = True
 
+        # A cache hit skips on_pack_post, which would have saved the fingerprint
+        if new_fingerprint and context.data.get('skip_pack'):
+            await self._save_metadata()
+
         # Store source hash for post-hook
         context.metadata['source_hash'] = source_hash
 
@@ -134,15 +243,14 @@ class CachePlugin(Plugin):
         version = context.data.get('version')
         source_hash = context.metadata.get('source_hash')
 
-        if all([archive_path, package_type, version, source_hash]):
+        if archive_path and package_type and version and source_hash:
             # Copy to cache
             archive_path = Path(archive_path)
             cache_name = f"{package_type}-{version}-{source_hash[:8]}.tar.gz"
             cached_path = self.cache_dir / cache_name
 
             try:
-                import shutil
-                shutil.copy2(archive_path, cached_path)
+                clone_file(archive_path, cached_path)
 
                 # Update metadata
                 cache_key = self._get_cache_key('pack', {
@@ -153,15 +261,14 @@ class CachePlugin(Plugin):
 
                 self.cache_metadata[cache_key] = {
                     'archive_name': cache_name,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': time.time(),
                     'size': archive_path.stat().st_size
                 }
 
-                self._save_metadata()
-                self.logger.info(f"Cached archive for {package_type}:{version}")
-
-                # Clean old cache entries if needed
+                # Clean old cache entries if needed, then save everything once
                 await self._cleanup_cache()
+                await self._save_metadata()
+                self.logger.info(f"Cached archive for {package_type}:{version}")
 
             except Exception as e:
                 self.logger.warning(f"Failed to cache archive: {e}")
@@ -174,16 +281,38 @@ class CachePlugin(Plugin):
         checksum = context.data.get('expected_checksum')
 
         if remote_path and checksum:
-            # Look for cached file by checksum
-            for cache_file in self.cache_dir.glob("*.tar.gz"):
-                if checksum[:8] in cache_file.name:
-                    # Verify full checksum
-                    actual_checksum = calculate_file_hash(cache_file)
-                    if actual_checksum == checksum:
-                        self.logger.info(f"Cache hit for download: {remote_path}")
-                        context.data['cached_file'] = str(cache_file)
-                        context.data['skip_download'] = True
-                        break
+            # Look up the cached file by checksum; misses cost no file I/O
+            download_key = self._get_download_key(checksum)
+            cache_entry = self.cache_metadata.get(download_key)
+            if cache_entry:
+                cache_file = self.cache_dir / cache_entry['archive_name']
+                try:
+                    stat = cache_file.stat()
+                except OSError:
+                    stat = None
+
+                if stat is None:
+                    valid = False
+                elif (stat.st_size == cache_entry.get('size')
+                      and stat.st_mtime_ns == cache_entry.get('mtime_ns')):
+                    # Untouched since it was cached: the recorded checksum still holds
+                    valid = True
+                else:
+                    # Changed (or cached by an older version): verify the full checksum
+                    valid = await _hash_file(cache_file) == checksum
+                    if valid:
+                        cache_entry['size'] = stat.st_size
+                        cache_entry['mtime_ns'] = stat.st_mtime_ns
+                        await self._save_metadata()
+
+                if valid:
+                    self.logger.info(f"Cache hit for download: {remote_path}")
+                    context.data['cached_file'] = str(cache_file)
+                    context.data['skip_download'] = True
+                else:
+                    # Stale entry: file removed or modified outside the plugin
+                    del self.cache_metadata[download_key]
+                    await self._save_metadata()
 
         return context
 
@@ -202,8 +331,19 @@ class CachePlugin(Plugin):
             cached_path = self.cache_dir / cache_name
 
             try:
-                import shutil
-                shutil.copy2(local_path, cached_path)
+                clone_file(local_path, cached_path)
+                stat = cached_path.stat()
+
+                # Index by checksum for on_storage_download_pre; size and mtime
+                # let later hits skip re-hashing an unchanged file
+                self.cache_metadata[self._get_download_key(checksum)] = {
+                    'archive_name': cache_name,
+                    'timestamp': time.time(),
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns
+                }
+
+                await self._save_metadata()
                 self.logger.info(f"Cached downloaded file: {local_path.name}")
             except Exception as e:
                 self.logger.warning(f"Failed to cache download: {e}")
@@ -211,32 +351,41 @@ class CachePlugin(Plugin):
         return context
 
     async def _cleanup_cache(self) -> None:
-        """Clean up old or oversized cache"""
+        """Clean up old or oversized cache (metadata is pruned, not saved)"""
+        # Source fingerprints have no cache file; drop those past the TTL
+        for key, entry in list(self.cache_metadata.items()):
+            if 'archive_name' not in entry and not self._is_cache_valid(entry):
+                del self.cache_metadata[key]
+
         try:
-            # Calculate total cache size
-            total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*") if f.is_file())
+            # One directory pass collecting (mtime, size, name) of every cache file
+            cache_files = []
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        cache_files.append((stat.st_mtime, stat.st_size, entry.name))
+
+            total_size = sum(size for _, size, _ in cache_files)
             max_size = self.max_cache_size_mb * 1024 * 1024
 
             if total_size > max_size:
-                # Remove oldest files
-                cache_files = sorted(
-                    self.cache_dir.glob("*"),
-                    key=lambda f: f.stat().st_mtime
-                )
-
-                while total_size > max_size * 0.8 and cache_files:  # Keep 80% threshold
-                    oldest = cache_files.pop(0)
-                    if oldest.is_file() and oldest != self.cache_metadata_file:
-                        size = oldest.stat().st_size
-                        oldest.unlink()
+                # Remove oldest files; a heap pops only as many as get evicted
+                heapq.heapify(cache_files)
+                removed = set()
+
+                while cache_files and total_size > max_size * 0.8:  # Keep 80% threshold
+                    _, size, name = heapq.heappop(cache_files)
+                    if name != self.cache_metadata_file.name:
+                        os.unlink(os.path.join(self.cache_dir, name))
+                        removed.add(name)
                         total_size -= size
 
-                        # Remove from metadata
-                        for key, entry in list(self.cache_metadata.items()):
-                            if entry.get('archive_name') == oldest.name:
-                                del self.cache_metadata[key]
+                # Remove from metadata
+                for key, entry in list(self.cache_metadata.items()):
+                    if entry.get('archive_name') in removed:
+                        del self.cache_metadata[key]
 
-                self._save_metadata()
                 self.logger.info("Cache cleanup completed")
 
         except Exception as e:
@@ -245,12 +394,13 @@ class CachePlugin(Plugin):
     async def clear_cache(self) -> None:
         """Clear all cache"""
         try:
-            for cache_file in self.cache_dir.glob("*"):
-                if cache_file != self.cache_metadata_file:
-                    cache_file.unlink()
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name != self.cache_metadata_file.name:
+                        os.unlink(entry.path)
 
             self.cache_metadata.clear()
-            self._save_metadata()
+            await self._save_metadata()
 
             self.logger.info("Cache cleared")
 
@@ -11,6 +11,15 @@ from ...utils.git_utils import (
     suggest_git_commands
 )
 
+# Patterns appended to a project .gitignore by _update_gitignore
+_GITIGNORE_PATTERNS = (
+    "/dist/",
+    "*.tar.gz",
+    "*.tar.bz2",
+    "*.tar.xz",
+    ".deploy-tool-cache/",
+)
+
 
 class GitIntegrationPlugin(Plugin):
     """Provides Git integration and automation suggestions"""
@@ -122,33 +131,21 @@ class GitIntegrationPlugin(Plugin):
 
     def _update_gitignore(self, gitignore_path: Path) -> None:
         """Update .gitignore with deployment-specific patterns"""
-        patterns_to_add = [
-            "# Deploy Tool",
-            "/dist/",
-            "*.tar.gz",
-            "*.tar.bz2",
-            "*.tar.xz",
-            ".deploy-tool-cache/",
-            "",  # Empty line
-        ]
-
         try:
             with open(gitignore_path, 'r') as f:
                 content = f.read()
 
-            # Check if patterns already exist
-            needs_update = False
-            for pattern in patterns_to_add[1:-1]:  # Skip comment and empty line
-                if pattern and pattern not in content:
-                    needs_update = True
-                    break
+            # Compare whole lines: a substring test would count "*.tar.gz"
+            # as present in "foo*.tar.gz.bak"
+            existing = {line.strip() for line in content.splitlines()}
+            missing = [pattern for pattern in _GITIGNORE_PATTERNS if pattern not in existing]
 
-            if needs_update:
-                # Append patterns
+            if missing:
+                # Append only the missing patterns
                 with open(gitignore_path, 'a') as f:
-                    if not content.endswith('\n'):
+                    if content and not content.endswith('\n'):
                         f.write('\n')
-                    f.write('\n'.join(patterns_to_add))
+                    f.write('\n'.join(["# Deploy Tool", *missing, ""]))
 
                 self.logger.info("Updated .gitignore with deployment patterns")
 
@@ -2,12 +2,17 @@
 """Lifecycle hooks plugin for custom scripts"""
 
 import asyncio
+import itertools
+import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..base import Plugin, PluginInfo, PluginContext, PluginPriority, HookPoint
 
+# Context data values exported to hook scripts as DEPLOY_TOOL_* variables
+_ENV_VALUE_TYPES = (str, int, float, bool)
+
 
 class LifecycleHooksPlugin(Plugin):
     """Execute custom scripts at various lifecycle points"""
@@ -18,7 +23,12 @@ class LifecycleHooksPlugin(Plugin):
         # Hook scripts configuration
         self.hooks_dir = Path(config.get('hooks_dir', '.deploy-tool/hooks')) if config else Path('.deploy-tool/hooks')
         self.timeout = config.get('timeout', 300) if config else 300  # 5 minutes default
-        self.enabled_hooks = config.get('enabled_hooks', []) if config else []
+        self.enabled_hooks = set(config.get('enabled_hooks', [])) if config else set()
+
+        # Scripts found per hook name, valid while the hooks directory is unchanged
+        self._scripts_by_hook: Dict[str, List[Path]] = {}
+        self._scripts_dir_key: Optional[Tuple[int, int]] = None  # (st_ino, st_mtime_ns)
+        self._script_names: List[str] = []
 
     def get_info(self) -> PluginInfo:
         return PluginInfo(
@@ -27,10 +37,20 @@ class LifecycleHooksPlugin(Plugin):
             description="Execute custom scripts at lifecycle points",
             author="Deploy Tool Team",
             priority=PluginPriority.LOW,  # Run after other plugins
-            hook_points=list(HookPoint),  # Register for all hooks
+            hook_points=self._enabled_hook_points(),
             config=self.config
         )
 
+    def _enabled_hook_points(self) -> List[HookPoint]:
+        """Get hook points allowed by the enabled_hooks config (all by default)"""
+        # Registration is fixed once plugin info is cached, so only the static
+        # config narrows it; hook points without scripts are skipped in
+        # handle_hook by the cached script lookup, which sees new scripts
+        return [
+            hook_point for hook_point in HookPoint
+            if not self.enabled_hooks or hook_point.value in self.enabled_hooks
+        ]
+
     async def handle_hook(self, context: PluginContext) -> PluginContext:
         """Execute scripts for any hook point"""
         hook_name = context.hook_point.value
@@ -41,57 +61,85 @@ class LifecycleHooksPlugin(Plugin):
 
         # Find hook scripts
         scripts = self._find_hook_scripts(hook_name)
+        if not scripts:
+            return context
 
-        for script in scripts:
-            try:
-                self.logger.info(f"Executing hook script: {script}")
-                success = await self._execute_script(script, context)
+        # Tiers run in order; scripts sharing a numeric prefix (e.g. two
+        # "10-pack-pre-*" scripts) declare no order and run concurrently
+        for _, tier in itertools.groupby(scripts, key=self._script_tier):
+            await asyncio.gather(*(self._run_script(script, context) for script in tier))
 
-                if not success:
-                    context.add_warning(f"Hook script failed: {script}")
+        return context
 
-            except Exception as e:
-                self.logger.error(f"Error executing hook script {script}: {e}")
-                context.add_error(f"Hook script error: {str(e)}")
+    @staticmethod
+    def _script_tier(script: Path) -> str:
+        """Get ordering tier of a script: its NN- prefix, or the script itself"""
+        name = script.name
+        if name[:2].isdigit() and name[2:3] == '-':
+            return name[:2]
+        return str(script)
 
-        return context
+    async def _run_script(self, script: Path, context: PluginContext) -> None:
+        """Execute one hook script, recording failures on the context"""
+        try:
+            self.logger.info(f"Executing hook script: {script}")
+            success = await self._execute_script(script, context)
+
+            if not success:
+                context.add_warning(f"Hook script failed: {script}")
+
+        except Exception as e:
+            self.logger.error(f"Error executing hook script {script}: {e}")
+            context.add_error(f"Hook script error: {str(e)}")
 
     def _find_hook_scripts(self, hook_name: str) -> List[Path]:
         """Find scripts for a specific hook"""
-        scripts = []
-
         # Look in project-specific hooks directory
-        if self.hooks_dir.exists():
+        try:
+            stat = self.hooks_dir.stat()
+        except OSError:
+            return []
+
+        # Adding, removing or renaming a script changes the directory mtime;
+        # list it again only then, instead of probing it on every hook
+        dir_key = (stat.st_ino, stat.st_mtime_ns)
+        if dir_key != self._scripts_dir_key:
+            with os.scandir(self.hooks_dir) as entries:
+                self._script_names = [entry.name for entry in entries if entry.is_file()]
+            self._scripts_by_hook = {}
+            self._scripts_dir_key = dir_key
+
+        scripts = self._scripts_by_hook.get(hook_name)
+        if scripts is None:
             # Convert hook.point.name to hook-point-name format
             script_prefix = hook_name.replace('.', '-')
+            plain_names = {f"{script_prefix}{ext}" for ext in ['.sh', '.py', '.js', '']}
+
+            # Plain scripts, plus numbered scripts (NN-<prefix>*) for ordering
+            scripts = sorted(
+                self.hooks_dir / name
+                for name in self._script_names
+                if name in plain_names or (
+                    name[:2].isdigit() and name[2:3] == '-' and name[3:].startswith(script_prefix)
+                )
+            )
+            self._scripts_by_hook[hook_name] = scripts
 
-            # Find all matching scripts
-            for ext in ['.sh', '.py', '.js', '']:
-                script_path = self.hooks_dir / f"{script_prefix}{ext}"
-                if script_path.exists() and script_path.is_file():
-                    scripts.append(script_path)
-
-            # Also look for numbered scripts (for ordering)
-            for script in sorted(self.hooks_dir.glob(f"[0-9][0-9]-{script_prefix}*")):
-                if script.is_file():
-                    scripts.append(script)
-
-        return sorted(scripts)
+        return scripts
 
     async def _execute_script(self, script_path: Path, context: PluginContext) -> bool:
         """Execute a hook script"""
-        # Prepare environment variables
-        env = os.environ.copy()
-
-        # Add context data as environment variables
-        env['DEPLOY_TOOL_HOOK'] = context.hook_point.value
-        env['DEPLOY_TOOL_OPERATION'] = context.operation
-
-        # Add specific context data
-        for key, value in context.data.items():
-            if isinstance(value, (str, int, float, bool)):
-                env_key = f"DEPLOY_TOOL_{key.upper()}"
-                env[env_key] = str(value)
+        # Prepare environment variables: current environment plus context data
+        env = {
+            **os.environ,
+            'DEPLOY_TOOL_HOOK': context.hook_point.value,
+            'DEPLOY_TOOL_OPERATION': context.operation,
+            **{
+                f"DEPLOY_TOOL_{key.upper()}": str(value)
+                for key, value in context.data.items()
+                if isinstance(value, _ENV_VALUE_TYPES)
+            },
+        }
 
         # Determine how to execute the script
         if script_path.suffix == '.py':
@@ -113,23 +161,22 @@ class LifecycleHooksPlugin(Plugin):
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Wait with timeout
+            # Wait with timeout, logging output as it is produced
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self._pump_output(process.stdout, logging.INFO, "Hook output"),
+                        self._pump_output(process.stderr, logging.WARNING, "Hook error"),
+                        process.wait()
+                    ),
                     timeout=self.timeout
                 )
 
-                # Log output
-                if stdout:
-                    self.logger.info(f"Hook output: {stdout.decode().strip()}")
-                if stderr:
-                    self.logger.warning(f"Hook error: {stderr.decode().strip()}")
-
                 return process.returncode == 0
 
             except asyncio.TimeoutError:
                 process.kill()
+                await process.wait()
                 self.logger.error(f"Hook script timed out after {self.timeout}s")
                 return False
 
@@ -137,6 +184,21 @@ class LifecycleHooksPlugin(Plugin):
             self.logger.error(f"Failed to execute hook script: {e}")
             return False
 
+    async def _pump_output(self, stream: asyncio.StreamReader, level: int, label: str) -> None:
+        """Log a script output stream line by line until EOF"""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line exceeded the stream buffer limit; it has been discarded
+                self.logger.log(level, f"{label}: <line too long, skipped>")
+                continue
+            if not line:
+                break
+            line = line.decode(errors='replace').rstrip()
+            if line:
+                self.logger.log(level, f"{label}: {line}")
+
     def create_hook_template(self, hook_name: str, script_type: str = 'sh') -> Optional[Path]:
         """Create a template hook script"""
         # Ensure hooks directory exists
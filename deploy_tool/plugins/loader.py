@@ -5,12 +5,55 @@ import importlib
 import importlib.util
 import inspect
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from .base import Plugin, PluginManager
 
+# Modules providing the built-in plugins
+_BUILTIN_MODULES = (
+    'deploy_tool.plugins.builtin.git_integration',
+    'deploy_tool.plugins.builtin.cache',
+    'deploy_tool.plugins.builtin.hooks',
+)
+
+
+def _iter_plugin_classes(module):
+    """Yield (name, class) of concrete plugin classes defined in a module"""
+    # The module namespace directly: no sorted getattr() sweep like
+    # inspect.getmembers, and imported plugin classes are left to their own module
+    for name, obj in list(vars(module).items()):
+        if (isinstance(obj, type) and
+                obj.__module__ == module.__name__ and
+                issubclass(obj, Plugin) and
+                obj is not Plugin and
+                not inspect.isabstract(obj)):
+            yield name, obj
+
+
+def _scan_plugin_files(plugin_dir: Path) -> List[os.DirEntry]:
+    """List plugin source files (*.py, not _private) in a directory"""
+    try:
+        with os.scandir(plugin_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith('_') and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def _dir_token(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (st_ino, st_mtime_ns) of a directory, None if it is missing"""
+    # Adding, removing or renaming a file changes the directory mtime
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
 
 class PluginLoader:
     """Load plugins from various sources"""
@@ -26,6 +69,9 @@ class PluginLoader:
         self.logger = logging.getLogger("PluginLoader")
         self._loaded_modules = set()
 
+        # discover_plugins results per directory list, with the directory tokens they saw
+        self._discover_cache: Dict[Tuple[Path, ...], Tuple[tuple, Dict[str, List[str]]]] = {}
+
     def load_builtin_plugins(self) -> int:
         """
         Load all built-in plugins
@@ -33,16 +79,13 @@ class PluginLoader:
         Returns:
             Number of plugins loaded
         """
+        # Repeat calls: everything is registered already
+        if self._loaded_modules.issuperset(_BUILTIN_MODULES):
+            return 0
 
         count = 0
         # Import all builtin modules
-        builtin_modules = [
-            'deploy_tool.plugins.builtin.git_integration',
-            'deploy_tool.plugins.builtin.cache',
-            'deploy_tool.plugins.builtin.hooks',
-        ]
-
-        for module_name in builtin_modules:
+        for module_name in _BUILTIN_MODULES:
             try:
                 if module_name not in self._loaded_modules:
                     module = importlib.import_module(module_name)
@@ -69,27 +112,32 @@ class PluginLoader:
 
         count = 0
 
-        # Add directory to Python path
-        if str(plugin_dir) not in sys.path:
-            sys.path.insert(0, str(plugin_dir))
+        # Plugins may import sibling modules, at load time or later from their
+        # hooks; keep the directory on sys.path only if a plugin came from it
+        plugin_path = str(plugin_dir)
+        added_to_path = plugin_path not in sys.path
+        if added_to_path:
+            sys.path.insert(0, plugin_path)
 
-        # Find all Python files
-        for py_file in plugin_dir.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue
-
-            try:
-                module_name = py_file.stem
-                spec = importlib.util.spec_from_file_location(module_name, py_file)
+        try:
+            # Find all Python files
+            for entry in _scan_plugin_files(plugin_dir):
+                py_file = Path(entry.path)
+                try:
+                    module_name = entry.name[:-3]
+                    spec = importlib.util.spec_from_file_location(module_name, py_file)
 
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+                    if spec and spec.loader:
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
 
-                    count += self._load_plugins_from_module(module)
+                        count += self._load_plugins_from_module(module)
 
-            except Exception as e:
-                self.logger.error(f"Failed to load plugin from {py_file}: {e}")
+                except Exception as e:
+                    self.logger.error(f"Failed to load plugin from {py_file}: {e}")
+        finally:
+            if added_to_path and not count:
+                sys.path.remove(plugin_path)
 
         return count
 
@@ -129,22 +177,17 @@ class PluginLoader:
         """
         count = 0
 
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and
-                    issubclass(obj, Plugin) and
-                    obj is not Plugin and
-                    not inspect.isabstract(obj)):
-
-                try:
-                    # Create plugin instance
-                    plugin = obj()
+        for name, obj in _iter_plugin_classes(module):
+            try:
+                # Create plugin instance
+                plugin = obj()
 
-                    # Register with manager
-                    self.plugin_manager.register(plugin)
-                    count += 1
+                # Register with manager
+                self.plugin_manager.register(plugin)
+                count += 1
 
-                except Exception as e:
-                    self.logger.error(f"Failed to instantiate plugin {name}: {e}")
+            except Exception as e:
+                self.logger.error(f"Failed to instantiate plugin {name}: {e}")
 
         return count
 
@@ -158,6 +201,17 @@ class PluginLoader:
         Returns:
             Dictionary mapping plugin sources to plugin names
         """
+        from . import builtin
+        builtin_path = Path(builtin.__file__).parent
+        user_plugin_dir = Path.home() / ".deploy-tool" / "plugins"
+
+        # Rescan only when one of the directories changed since the last call
+        cache_key = (builtin_path, user_plugin_dir, *(search_paths or ()))
+        tokens = tuple(_dir_token(path) for path in cache_key)
+        cached = self._discover_cache.get(cache_key)
+        if cached and cached[0] == tokens:
+            return {source: list(names) for source, names in cached[1].items()}
+
         discovered = {
             'builtin': [],
             'user': [],
@@ -165,29 +219,18 @@ class PluginLoader:
         }
 
         # Discover builtin plugins
-        from . import builtin
-        builtin_path = Path(builtin.__file__).parent
-
-        for py_file in builtin_path.glob("*.py"):
-            if not py_file.name.startswith("_"):
-                discovered['builtin'].append(py_file.stem)
+        discovered['builtin'].extend(entry.name[:-3] for entry in _scan_plugin_files(builtin_path))
 
-        # Discover user plugins
-        user_plugin_dir = Path.home() / ".deploy-tool" / "plugins"
-        if user_plugin_dir.exists():
-            for py_file in user_plugin_dir.glob("*.py"):
-                if not py_file.name.startswith("_"):
-                    discovered['user'].append(py_file.stem)
+        # Discover user plugins (a missing directory scans as empty)
+        discovered['user'].extend(entry.name[:-3] for entry in _scan_plugin_files(user_plugin_dir))
 
         # Discover from additional paths
         if search_paths:
             for path in search_paths:
-                if path.exists() and path.is_dir():
-                    for py_file in path.glob("*.py"):
-                        if not py_file.name.startswith("_"):
-                            discovered['system'].append(py_file.stem)
+                discovered['system'].extend(entry.name[:-3] for entry in _scan_plugin_files(path))
 
-        return discovered
+        self._discover_cache[cache_key] = (tokens, discovered)
+        return {source: list(names) for source, names in discovered.items()}
 
     def reload_plugin(self, plugin_name: str) -> bool:
         """
@@ -207,21 +250,17 @@ class PluginLoader:
             module = sys.modules.get(module_name)
             if module:
                 # Check if this module contains the plugin
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and
-                            issubclass(obj, Plugin) and
-                            obj is not Plugin):
-
-                        try:
-                            plugin = obj()
-                            if plugin.get_info().name == plugin_name:
-                                # Reload the module
-                                importlib.reload(module)
-                                # Re-load plugins from it
-                                self._load_plugins_from_module(module)
-                                return True
-                        except:
-                            pass
+                for name, obj in _iter_plugin_classes(module):
+                    try:
+                        plugin = obj()
+                        if plugin.info.name == plugin_name:
+                            # Reload the module
+                            importlib.reload(module)
+                            # Re-load plugins from it
+                            self._load_plugins_from_module(module)
+                            return True
+                    except:
+                        pass
 
         return False
 
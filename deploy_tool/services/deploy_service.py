@@ -1,7 +1,6 @@
 ﻿# deploy_tool/services/deploy_service.py
 """Deploy service implementation"""
 
-import json
 import shutil
 import time
 from datetime import datetime
@@ -27,6 +26,7 @@ from ..models import (
     Component,
 )
 from ..models.manifest import ReleaseManifest
+from ..utils.json_utils import load_json_file, save_json_file
 
 
 class DeployService:
@@ -214,10 +214,7 @@ class DeployService:
                 raise ReleaseNotFoundError(release_version)
 
         # Load manifest
-        with open(release_path, 'r') as f:
-            data = json.load(f)
-
-        return ReleaseManifest.from_dict(data)
+        return ReleaseManifest.from_dict(load_json_file(release_path))
 
     def _extract_components_from_release(self, release_manifest: ReleaseManifest) -> List[Component]:
         """Extract component list from release manifest"""
@@ -315,8 +312,7 @@ class DeployService:
         if release_version:
             metadata['release_version'] = release_version
 
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        save_json_file(metadata_path, metadata)
 
     async def _verify_deployment(self,
                                  components: List[Component],
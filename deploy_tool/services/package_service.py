@@ -123,6 +123,7 @@ class PackageService:
                 version=version,
                 manifest_path=str(self.path_resolver.get_relative_to_root(manifest_path)),
                 archive_path=str(self.path_resolver.get_relative_to_root(archive_path)),
+                archive_size=manifest.archive['size'],
                 duration=time.time() - start_time,
                 metadata={
                     'file_count': len(files_info),
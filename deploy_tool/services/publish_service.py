@@ -24,6 +24,7 @@ from ..models import (
     PublishComponent,
 )
 from ..models.manifest import ReleaseManifest, ComponentRef
+from ..utils.json_utils import save_json_file
 
 
 class PublishService:
@@ -67,6 +68,7 @@ class PublishService:
         start_time = time.time()
         options = options or {}
         published_components = []
+        successful_components = []  # Filled as components publish, in order
         errors = []
 
         try:
@@ -85,11 +87,13 @@ class PublishService:
                 )
                 published_components.append(comp_result)
 
-                if not comp_result.success:
+                if comp_result.success:
+                    successful_components.append(comp_result)
+                else:
                     errors.append(comp_result.error)
                     if options.get('atomic', True):
                         # Rollback on atomic failure
-                        await self._rollback_published(published_components[:-1])
+                        await self._rollback_published(successful_components)
                         raise PublishError(f"Atomic publish failed: {comp_result.error}")
 
             # 4. Create and save release manifest
@@ -98,7 +102,7 @@ class PublishService:
                 release_manifest = self._create_release_manifest(
                     release_version,
                     release_name,
-                    published_components
+                    successful_components
                 )
 
                 release_manifest_path = await self._save_and_upload_release(
@@ -107,7 +111,7 @@ class PublishService:
                 )
 
                 # 5. Provide Git advice
-                self._provide_git_advice(release_version, published_components)
+                self._provide_git_advice(release_version, successful_components)
 
             # 6. Create result
             return PublishResult(
@@ -179,7 +183,10 @@ class PublishService:
                 raise PublishError(f"No archive location in manifest for {component}")
 
             archive_path = self.path_resolver.resolve(archive_location)
-            if not archive_path.exists():
+            # One stat() both checks the archive exists and gives its size
+            try:
+                archive_size = archive_path.stat().st_size
+            except OSError:
                 raise PublishError(f"Archive file not found: {archive_path}")
 
             # Check if already published
@@ -223,7 +230,7 @@ class PublishService:
 
             # Update component metadata
             component.archive_path = str(archive_path)
-            component.archive_size = archive_path.stat().st_size
+            component.archive_size = archive_size
             component.storage_path = storage_path
 
             # Calculate checksum if not present
@@ -247,33 +254,31 @@ class PublishService:
             )
 
     async def _rollback_published(self, components: List[ComponentPublishResult]) -> None:
-        """Rollback published components"""
+        """Rollback successfully published components"""
         for comp_result in components:
-            if comp_result.success:
-                try:
-                    await self.storage_manager.delete_component(
-                        comp_result.component.type,
-                        comp_result.component.version
-                    )
-                except Exception:
-                    # Ignore rollback errors
-                    pass
+            try:
+                await self.storage_manager.delete_component(
+                    comp_result.component.type,
+                    comp_result.component.version
+                )
+            except Exception:
+                # Ignore rollback errors
+                pass
 
     def _create_release_manifest(self,
                                  release_version: str,
                                  release_name: Optional[str],
                                  components: List[ComponentPublishResult]) -> ReleaseManifest:
-        """Create release manifest"""
+        """Create release manifest from successfully published components"""
         # Create component references
-        component_refs = []
-        for comp_result in components:
-            if comp_result.success:
-                ref = ComponentRef(
-                    type=comp_result.component.type,
-                    version=comp_result.component.version,
-                    manifest=comp_result.component.manifest_path
-                )
-                component_refs.append(ref)
+        component_refs = [
+            ComponentRef(
+                type=comp_result.component.type,
+                version=comp_result.component.version,
+                manifest=comp_result.component.manifest_path
+            )
+            for comp_result in components
+        ]
 
         # Create release info
         release_info = {
@@ -290,7 +295,7 @@ class PublishService:
             'total_size': sum(
                 c.component.archive_size
                 for c in components
-                if c.success and c.component.archive_size
+                if c.component.archive_size
             ),
             'published_by': self._get_publisher_info(),
         }
@@ -313,9 +318,7 @@ class PublishService:
 
         release_path.parent.mkdir(parents=True, exist_ok=True)
 
-        import json
-        with open(release_path, 'w') as f:
-            json.dump(release_manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        save_json_file(release_path, release_manifest)
 
         # Upload to storage
         await self.storage_manager.upload_release(
@@ -328,12 +331,8 @@ class PublishService:
     def _provide_git_advice(self,
                             release_version: str,
                             components: List[ComponentPublishResult]) -> None:
-        """Provide Git operation advice"""
-        manifest_paths = [
-            Path(c.component.manifest_path)
-            for c in components
-            if c.success
-        ]
+        """Provide Git operation advice for successfully published components"""
+        manifest_paths = [Path(c.component.manifest_path) for c in components]
 
         self.git_advisor.provide_post_publish_advice(
             release_version,
@@ -11,6 +11,11 @@ from .s3 import S3Storage
 from ..constants import DEFAULT_STORAGE_TYPE
 from ..core.path_resolver import PathResolver
 
+# Storage type aliases that share configuration handling
+_FILESYSTEM_TYPES = frozenset({'filesystem', 'fs', 'local'})
+_BOS_TYPES = frozenset({'bos', 'baidu'})
+_S3_TYPES = frozenset({'s3', 'aws'})
+
 
 class StorageFactory:
     """Factory for creating storage backend instances"""
@@ -52,7 +57,8 @@ class StorageFactory:
         storage_type = storage_type.lower()
 
         # Validate storage type
-        if storage_type not in cls._backends:
+        backend_class = cls._backends.get(storage_type)
+        if backend_class is None:
             raise ValueError(
                 f"Unsupported storage type: {storage_type}. "
                 f"Supported types: {', '.join(sorted(set(cls._backends.keys())))}"
@@ -63,9 +69,7 @@ class StorageFactory:
             config = cls._load_config_from_env(storage_type)
 
         # Create backend instance
-        backend_class = cls._backends[storage_type]
-
-        if storage_type in ['filesystem', 'fs', 'local']:
+        if storage_type in _FILESYSTEM_TYPES:
             # Filesystem backend needs path resolver
             return backend_class(config, path_resolver)
         else:
@@ -90,14 +94,14 @@ class StorageFactory:
         """Load configuration from environment variables"""
         config = {}
 
-        if storage_type in ['bos', 'baidu']:
+        if storage_type in _BOS_TYPES:
             # BOS configuration
             config['access_key'] = os.environ.get('BOS_AK') or os.environ.get('BOS_ACCESS_KEY')
             config['secret_key'] = os.environ.get('BOS_SK') or os.environ.get('BOS_SECRET_KEY')
             config['bucket'] = os.environ.get('BOS_BUCKET')
             config['endpoint'] = os.environ.get('BOS_ENDPOINT', 'https://bj.bcebos.com')
 
-        elif storage_type in ['s3', 'aws']:
+        elif storage_type in _S3_TYPES:
             # S3 configuration
             config['access_key_id'] = os.environ.get('AWS_ACCESS_KEY_ID')
             config['secret_access_key'] = os.environ.get('AWS_SECRET_ACCESS_KEY')
@@ -105,7 +109,7 @@ class StorageFactory:
             config['region'] = os.environ.get('AWS_REGION', 'us-east-1')
             config['endpoint_url'] = os.environ.get('S3_ENDPOINT_URL')
 
-        elif storage_type in ['filesystem', 'fs', 'local']:
+        elif storage_type in _FILESYSTEM_TYPES:
             # Filesystem configuration
             config['base_path'] = os.environ.get('DEPLOY_TOOL_STORAGE_PATH')
 
@@ -9,6 +9,7 @@ from .file_utils import (
     count_files,
     scan_directory,
     copy_with_progress,
+    clone_file,
 )
 
 from .git_utils import (
@@ -156,6 +157,7 @@ __all__ = [
     "count_files",
     "scan_directory",
     "copy_with_progress",
+    "clone_file",
 
     # Git utilities
     "is_git_repository",
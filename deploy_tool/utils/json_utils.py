@@ -0,0 +1,118 @@
+﻿# deploy_tool/utils/json_utils.py
+"""JSON encoding helpers with optional orjson acceleration"""
+
+import json
+from datetime import date
+from enum import Enum
+from operator import attrgetter
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Optional, Union
+
+# orjson is an optional dependency (pip install deploy-tool[orjson])
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Encoder per concrete class, resolved by _resolve_encoder on first sight
+_encoders: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+
+def _resolve_encoder(cls: type) -> Optional[Callable[[Any], Any]]:
+    """Pick the encoder for objects of a class the JSON backends do not handle"""
+    to_dict = getattr(cls, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict
+    if issubclass(cls, PurePath):
+        return str
+    if issubclass(cls, date):
+        return cls.isoformat
+    if issubclass(cls, Enum):
+        return attrgetter('value')
+    return None
+
+
+def _default(obj: Any) -> Any:
+    """Encode objects the JSON backends do not handle natively"""
+    cls = obj.__class__
+    try:
+        encoder = _encoders[cls]
+    except KeyError:
+        encoder = _encoders[cls] = _resolve_encoder(cls)
+    if encoder is None:
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+    return encoder(obj)
+
+
+def json_dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    Encode data as UTF-8 JSON
+
+    Models with a to_dict() method can be passed directly (also nested);
+    they are converted by the encoder as it reaches them.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        # Route dataclasses through to_dict() so omitted/renamed keys are kept
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=_default
+    ).encode('utf-8')
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON data
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded data
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path: Path) -> Any:
+    """
+    Load a JSON file
+
+    Args:
+        path: File path
+
+    Returns:
+        Decoded data
+    """
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def save_json_file(path: Path, data: Any, indent: bool = True) -> None:
+    """
+    Save data to a JSON file
+
+    Args:
+        path: File path
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+    """
+    with open(path, 'wb') as f:
+        f.write(json_dumps(data, indent=indent))
@@ -22,14 +22,15 @@ def render_template(template: str,
     Returns:
         Rendered string
     """
-    # Add common variables
+    # Add common variables (read the clock once so they all agree)
+    now = datetime.now()
     context = {
-        'NOW': datetime.now().isoformat(),
-        'DATE': datetime.now().strftime('%Y-%m-%d'),
-        'TIME': datetime.now().strftime('%H:%M:%S'),
-        'YEAR': str(datetime.now().year),
-        'MONTH': str(datetime.now().month).zfill(2),
-        'DAY': str(datetime.now().day).zfill(2),
+        'NOW': now.isoformat(),
+        'DATE': now.strftime('%Y-%m-%d'),
+        'TIME': now.strftime('%H:%M:%S'),
+        'YEAR': str(now.year),
+        'MONTH': f'{now.month:02d}',
+        'DAY': f'{now.day:02d}',
         'USER': os.environ.get('USER', 'unknown'),
         'HOME': str(Path.home()),
     }
@@ -1,12 +1,25 @@
 ﻿# deploy_tool/utils/version_utils.py
 """Version management utilities"""
 
+from functools import lru_cache
 from typing import Optional, Tuple, List
 
 from packaging.version import parse, Version, InvalidVersion
 
 from ..constants import VERSION_PATTERN
 
+# Sort key for invalid version strings (orders them last)
+_INVALID_VERSION = parse("0.0.0")
+
+
+@lru_cache(maxsize=1024)
+def _version_key(version_str: str) -> Version:
+    """Parse a version string for ordering (cached, the same versions recur)"""
+    try:
+        return parse(version_str)
+    except InvalidVersion:
+        return _INVALID_VERSION
+
 
 def parse_version(version_str: str) -> Optional[Version]:
     """
@@ -159,15 +172,7 @@ def sort_versions(versions: List[str], reverse: bool = True) -> List[str]:
     Returns:
         Sorted list
     """
-
-    def version_key(v: str):
-        try:
-            return parse(v)
-        except InvalidVersion:
-            # Put invalid versions at the end
-            return parse("0.0.0")
-
-    return sorted(versions, key=version_key, reverse=reverse)
+    return sorted(versions, key=_version_key, reverse=reverse)
 
 
 def get_latest_version(versions: List[str]) -> Optional[str]:
@@ -180,11 +185,7 @@ def get_latest_version(versions: List[str]) -> Optional[str]:
     Returns:
         Latest version or None
     """
-    if not versions:
-        return None
-
-    sorted_versions = sort_versions(versions, reverse=True)
-    return sorted_versions[0] if sorted_versions else None
+    return max(versions, key=_version_key, default=None)
 
 
 def version_in_range(version: str,